@@ -1,8 +1,10 @@
 import os
 import json
 import logging
+import functools
 from dotenv import load_dotenv
 from gina.version import __version__
+from gina.utils.json_utils import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -10,22 +12,19 @@ load_dotenv()
 
 
 class Config:
-    _config = None  # Cache for the loaded config file
 
-    @classmethod
-    def _load_config_file(cls, path: str = "config/config.json") -> dict:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)  # Cache for the loaded config file
+    def _load_config_file(path: str = "config/config.json") -> dict:
         """Loads the configuration JSON file."""
-        if cls._config is None:
-            try:
-                with open(path, "r") as file:
-                    cls._config = json.load(file)
-            except FileNotFoundError:
-                logger.error(f"Configuration file '{path}' not found.")
-                raise
-            except json.JSONDecodeError:
-                logger.error(f"Configuration file '{path}' contains invalid JSON.")
-                raise
-        return cls._config
+        try:
+            return load_json_file(path)
+        except FileNotFoundError:
+            logger.error(f"Configuration file '{path}' not found.")
+            raise
+        except json.JSONDecodeError:
+            logger.error(f"Configuration file '{path}' contains invalid JSON.")
+            raise
 
     @classmethod
     def get_env_variable(cls, var_name: str) -> str:
@@ -39,8 +38,7 @@ class Config:
     @classmethod
     def get_config_value(cls, key: str, default=None):
         """Fetches a value from the config file, with an optional default."""
-        config = cls._load_config_file()
-        return config.get(key, default)
+        return cls._load_config_file().get(key, default)
 
     @classmethod
     def get_version(cls) -> str:
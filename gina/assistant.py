@@ -1,3 +1,6 @@
+import sys
+import time
+import threading
 from gina.utils.openai.openai_service import OpenAIService
 
 
@@ -23,12 +26,35 @@ class Assistant:
         # Add message to OpenAI service
         self.openai_service.add_message(role=role, message=message)
 
-        # Define a callback to handle the streaming output
+        _write = sys.stdout.write
+        _flush = sys.stdout.flush
+        last_flush: float = time.monotonic()
+        trailing_flush: threading.Timer | None = None
+
+        def flush() -> None:
+            nonlocal last_flush, trailing_flush
+            if trailing_flush:
+                trailing_flush.cancel()
+                trailing_flush = None
+            _flush()
+            last_flush = time.monotonic()
+
+        # Define a callback to handle the streaming output, flushing at most every 50ms
         def stream_printer(content: str):
-            print(content, end="", flush=True)  # Print without a newline
+            nonlocal trailing_flush
+            _write(content)
+
+            if time.monotonic() - last_flush > 0.05:
+                flush()
+            elif trailing_flush is None:
+                # Show throttled content even if the stream pauses before the next chunk
+                trailing_flush = threading.Timer(0.05, flush)
+                trailing_flush.daemon = True
+                trailing_flush.start()
 
-        # Call get_completion with the callback
-        response = self.openai_service.get_completion(stream_callback=stream_printer)
+        # Call get_completion with the callback, flushing once the stream ends and before any tool runs
+        response = self.openai_service.get_completion(stream_callback=stream_printer, stream_end_callback=flush)
 
+        flush()
         print()
         return response
@@ -1 +1,2 @@
-from .singleton import singleton
\ No newline at end of file
+from .singleton import singleton
+from .read_only import read_only
\ No newline at end of file
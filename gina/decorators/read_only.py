@@ -0,0 +1,6 @@
+def read_only(func):
+    """
+    Flags a tool function as free of side effects, so it may run concurrently with other read-only tools
+    """
+    func._is_read_only = True
+    return func
@@ -1,9 +1,18 @@
+import threading
+
+
 def singleton(cls):
     instances: dict = {}
+    lock: threading.Lock = threading.Lock()
 
     def get_instance(*args, **kwargs):
         if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
+            with lock:
+                if cls not in instances:
+                    instances[cls] = cls(*args, **kwargs)
         return instances[cls]
-    
+
+    # Keep the decorated class reachable, e.g. to build instances in tests
+    get_instance.__wrapped__ = cls
+
     return get_instance
\ No newline at end of file
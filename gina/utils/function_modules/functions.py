@@ -1,105 +1,364 @@
 import os
 import json
 import inspect
+import itertools
 import importlib
 from logging import Logger
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import Config
 from gina.utils.logger import setup_logger
-from typing import Callable, List, Dict, Any
+from gina.utils.json_utils import load_json_file
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Any
 
 logger: Logger = setup_logger(__name__)
 
-def import_methods_from_modules(modules_path: str = Config.get_config_value(key="functions_path")) -> Dict[str, Callable]:
+_discovery_cache_path: str = ".gina_discovery_cache.json"
+
+# Classes found in each module, keyed by module name, with the mtime of the module file
+_class_cache: Dict[str, Tuple[int, List[Tuple[str, type]]]] = {}
+
+def _is_pruned_dir(name: str) -> bool:
+    """
+    Checks whether a directory should be skipped while walking the functions tree.
+
+    Args:
+        name (str): The directory name.
+
+    Returns:
+        bool: True for hidden and dunder directories such as `.git` or `__pycache__`.
+    """
+    return name.startswith((".", "__"))
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """
+    Recursively yields the paths of Python files located under a directory.
+
+    Uses `os.scandir` so the file type is read from the directory entry instead of
+    an extra `stat()` call per entry.
+
+    Args:
+        root (str): The directory to walk.
+
+    Returns:
+        Iterator[str]: The paths of the `.py` files found.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not _is_pruned_dir(entry.name):
+                    yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+def _iter_named_files(root: str, file_name: str) -> Iterator[str]:
+    """
+    Recursively yields the paths of files with a given name located under a directory.
+
+    Args:
+        root (str): The directory to walk.
+        file_name (str): The exact file name to look for.
+
+    Returns:
+        Iterator[str]: The paths of the matching files found.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not _is_pruned_dir(entry.name):
+                    yield from _iter_named_files(entry.path, file_name)
+            elif entry.name == file_name:
+                yield entry.path
+
+def _tree_fingerprint(root: str) -> int:
+    """
+    Computes a fingerprint of a directory tree from the modification times of its entries.
+
+    Args:
+        root (str): The directory to fingerprint.
+
+    Returns:
+        int: The highest `st_mtime_ns` found in the tree, pruned directories excluded.
+    """
+    fingerprint: int = os.stat(root).st_mtime_ns
+
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not _is_pruned_dir(entry.name):
+                    fingerprint = max(fingerprint, _tree_fingerprint(entry.path))
+            else:
+                fingerprint = max(fingerprint, entry.stat(follow_symlinks=False).st_mtime_ns)
+
+    return fingerprint
+
+def _discovery_cache_enabled() -> bool:
+    """
+    Checks whether the on-disk discovery cache may be used.
+
+    Returns:
+        bool: False if the `GINA_DISABLE_DISCOVERY_CACHE` environment variable is set, True otherwise.
+    """
+    return not os.getenv("GINA_DISABLE_DISCOVERY_CACHE")
+
+def _read_discovery_cache(section: str, modules_path: str, fingerprint: int) -> Any:
+    """
+    Reads a section of the discovery cache if it matches the given directory and fingerprint.
+
+    Args:
+        section (str): The cache section to read (e.g. "methods" or "tools").
+        modules_path (str): The directory the cached data was discovered from.
+        fingerprint (int): The current fingerprint of the directory.
+
+    Returns:
+        Any: The cached data, or None if there is no valid cache entry.
+    """
+    try:
+        with open(_discovery_cache_path, "r", encoding="utf-8") as f:
+            entry: Dict[str, Any] = json.load(f).get(section, {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if entry.get("path") != modules_path or entry.get("fingerprint") != fingerprint:
+        return None
+
+    return entry.get("data")
+
+def _write_discovery_cache(section: str, modules_path: str, fingerprint: int, data: Any) -> None:
+    """
+    Writes a section of the discovery cache, replacing the cache file atomically.
+
+    Args:
+        section (str): The cache section to write (e.g. "methods" or "tools").
+        modules_path (str): The directory the data was discovered from.
+        fingerprint (int): The fingerprint of the directory.
+        data (Any): The JSON-serializable data to cache.
+    """
+    try:
+        with open(_discovery_cache_path, "r", encoding="utf-8") as f:
+            cache: Dict[str, Any] = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    cache[section] = {"path": modules_path, "fingerprint": fingerprint, "data": data}
+
+    tmp_path: str = _discovery_cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, _discovery_cache_path)
+    except OSError as e:
+        logger.error(f"Error writing discovery cache {_discovery_cache_path}: {e}")
+
+def _module_classes(module) -> List[Tuple[str, type]]:
+    """
+    Gets the classes of a module, reusing the previous result while the module file is unchanged.
+
+    Args:
+        module: The imported module.
+
+    Returns:
+        List[Tuple[str, type]]: The `(name, class)` pairs defined in the module, in definition order.
+    """
+    mtime: int = os.stat(module.__file__).st_mtime_ns
+    cached = _class_cache.get(module.__name__)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    classes: List[Tuple[str, type]] = [
+        (name, obj)
+        for name, obj in vars(module).items()
+        if isinstance(obj, type) and obj.__module__ == module.__name__
+    ]
+
+    # An empty scan may come from a partially imported module, so it is never cached
+    if classes:
+        _class_cache[module.__name__] = (mtime, classes)
+
+    return classes
+
+def _methods_from_cache(entries: List[List[Any]]) -> Dict[str, Callable]:
+    """
+    Rebuilds the methods dictionary from cached discovery entries.
+
+    Args:
+        entries (List[List[Any]]): A list of `[module_name, class_name, method_names]` entries.
+
+    Returns:
+        Dict[str, Callable]: A dictionary where the keys are method names and the values are method callables.
+    """
+    methods: Dict[str, Callable] = {}
+
+    for module_name, class_name, method_names in entries:
+        module = importlib.import_module(module_name)
+        instance = getattr(module, class_name)()
+
+        for method_name in method_names:
+            methods[method_name] = getattr(instance, method_name)
+
+    return methods
+
+def _find_main_class(module_name: str) -> Tuple[Optional[type], bool]:
+    """
+    Imports a module and finds its main class.
+
+    Args:
+        module_name (str): The dotted name of the module.
+
+    Returns:
+        Tuple[Optional[type], bool]: The first concrete class defined in the module, or None if there
+            is none, and whether the module could be imported.
+    """
+    logger.debug(f"Checking module: {module_name}")
+
+    # Attempt to import the module, import_module returns finished modules from sys.modules
+    # and waits on the module lock while another thread is still importing it
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        logger.error(f"Error importing module {module_name}: {e}")
+        return None, False
+
+    # The main class is the first class of the module that is not abstract
+    main_class: Optional[type] = next(
+        (cls for name, cls in _module_classes(module) if not cls.__dict__.get("__abstractmethods__")),
+        None,
+    )
+
+    return main_class, True
+
+def import_methods_from_modules(modules_path: str = None) -> Dict[str, Callable]:
     """
     Dynamically imports methods from Python modules located in the specified directory.
 
     Args:
-        modules_path (str): The path to the directory containing Python modules.
+        modules_path (str, optional): The path to the directory containing Python modules.
+            Defaults to the `functions_path` config value.
 
     Returns:
         Dict[str, Callable]: A dictionary where the keys are method names and the values are method callables.
     """
+    modules_path = modules_path or Config.get_config_value(key="functions_path")
     logger.debug(f"Importing methods from {modules_path}")
     methods: Dict[str, Callable] = {}
 
-    for root, dirs, files in os.walk(modules_path):
-        for file in files:
-            logger.debug(f"Checking file: {file}")
-            if file.endswith(".py"):
-                # Build the module path and name
-                module_path: str = os.path.join(root, file)
-                module_name: str = (
-                    module_path.replace("/", ".").replace("\\", ".").replace(".py", "")
-                )
-
-                # Attempt to import the module
-                try:
-                    module = importlib.import_module(module_name)
-                except ImportError as e:
-                    logger.error(f"Error importing module {module_name}: {e}")
-                    continue
-
-                # Get all classes in the module
-                all_classes = inspect.getmembers(module, inspect.isclass)
-
-                # Filter for the main class
-                main_class = None
-                for name, cls in all_classes:
-                    if (
-                        cls.__module__
-                        == module.__name__  # Ensure class is from this module
-                        and not inspect.isabstract(cls)  # Skip abstract classes
-                    ):
-                        main_class = cls
-                        break
-
-                if main_class:
-                    try:
-                        # Try to create an instance of the main class
-                        instance = main_class()
-                    except TypeError as e:
-                        logger.error(f"Error creating instance of {main_class}: {e}")
-                        continue
-
-                    logger.debug(f"instance: {instance}")
-
-                    # Extract methods from the main class
-                    for method_name, method in inspect.getmembers(
-                        main_class, inspect.isfunction
-                    ):
-                        if method_name != "__init__":
-                            methods[method_name] = getattr(instance, method_name)
-                            logger.debug(f"Added method: {method_name}")
+    use_cache: bool = _discovery_cache_enabled()
+    if use_cache:
+        fingerprint: int = _tree_fingerprint(modules_path)
+        cached_entries = _read_discovery_cache("methods", modules_path, fingerprint)
+
+        if cached_entries is not None:
+            try:
+                methods = _methods_from_cache(cached_entries)
+                logger.debug(f"Loaded {len(methods)} method(s) from discovery cache")
+                return methods
+            except (ImportError, AttributeError, TypeError) as e:
+                logger.error(f"Invalid discovery cache, rediscovering methods: {e}")
+                methods = {}
+
+    cache_entries: List[List[Any]] = []
+
+    # Failed imports or instantiations must not be cached, they are retried on the next run
+    complete: bool = True
+
+    # Build the module names from the Python files found
+    module_names: List[str] = [
+        os.path.splitext(os.path.normpath(module_path))[0].replace(os.sep, ".")
+        for module_path in _iter_py_files(modules_path)
+    ]
+
+    # Import the modules and find their main class, in parallel unless there are only a few
+    if len(module_names) < 4:
+        results: List[Tuple[Optional[type], bool]] = [_find_main_class(module_name) for module_name in module_names]
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_find_main_class, module_names))
+
+    for module_name, (main_class, imported) in zip(module_names, results):
+        complete = complete and imported
+
+        if main_class:
+            try:
+                # Try to create an instance of the main class
+                instance = main_class()
+            except TypeError as e:
+                logger.error(f"Error creating instance of {main_class}: {e}")
+                complete = False
+                continue
+
+            logger.debug(f"instance: {instance}")
+
+            # Extract methods from the main class
+            method_names: List[str] = []
+            for method_name, method in vars(main_class).items():
+                if inspect.isfunction(method) and not method_name.startswith("_"):
+                    methods[method_name] = getattr(instance, method_name)
+                    method_names.append(method_name)
+                    logger.debug(f"Added method: {method_name}")
+
+            cache_entries.append([module_name, main_class.__name__, method_names])
+
+    if use_cache and complete:
+        _write_discovery_cache("methods", modules_path, fingerprint, cache_entries)
 
     return methods
 
+def _load_tools_file(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Loads the tools defined in a single `tools.json` file.
+
+    Args:
+        file_path (str): The path to the `tools.json` file.
+
+    Returns:
+        List[Dict[str, Any]]: The tools defined in the file, or an empty list if it could not be loaded.
+    """
+    try:
+        return load_json_file(file_path)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.error(f"Error loading tools from {file_path}: {e}")
+        return []
+
 def combine_tools_json(
-    modules_path: str = Config.get_config_value(key="functions_path"),
+    modules_path: str = None,
     additional_tools: List[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Combines all `tools.json` files from a given directory and optionally appends additional tools.
 
     Args:
-        modules_path (str): The path to the directory containing `tools.json` files.
+        modules_path (str, optional): The path to the directory containing `tools.json` files.
+            Defaults to the `functions_path` config value.
         additional_tools (List[Dict[str, Any]], optional): A list of additional tools to append. Defaults to None.
 
     Returns:
         List[Dict[str, Any]]: A combined list of tools from all `tools.json` files and additional tools.
     """
+    modules_path = modules_path or Config.get_config_value(key="functions_path")
     combined_tools: List[Dict[str, Any]] = []
 
+    use_cache: bool = _discovery_cache_enabled()
+    cached_tools = None
+    if use_cache:
+        fingerprint: int = _tree_fingerprint(modules_path)
+        cached_tools = _read_discovery_cache("tools", modules_path, fingerprint)
+
+    if cached_tools is not None:
+        combined_tools.extend(cached_tools)
+        if additional_tools:
+            combined_tools.extend(additional_tools)
+        return combined_tools
+
     # Traverse the directory and find all tools.json files
-    for root, dirs, files in os.walk(modules_path):
-        for file in files:
-            if file == "tools.json":
-                file_path: str = os.path.join(root, file)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        tools: List[Dict[str, Any]] = json.load(f)
-                        combined_tools.extend(tools)
-                except (FileNotFoundError, json.JSONDecodeError) as e:
-                    logger.error(f"Error loading tools from {file_path}: {e}")
+    file_paths: List[str] = list(_iter_named_files(modules_path, "tools.json"))
+
+    # Load the files concurrently, the reads are I/O bound
+    if file_paths:
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+            results = list(executor.map(_load_tools_file, file_paths))
+        combined_tools = list(itertools.chain.from_iterable(results))
+
+    if use_cache:
+        _write_discovery_cache("tools", modules_path, fingerprint, combined_tools)
 
     # Append additional tools if provided
     if additional_tools:
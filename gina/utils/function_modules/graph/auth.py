@@ -1,49 +1,74 @@
 import os
-import msal
-import pyperclip
-import webbrowser
-from typing import Any, List
+import time
+import threading
+from typing import TYPE_CHECKING, Any, List
 from logging import Logger
 from gina.utils.logger import setup_logger
 from gina.decorators.singleton import singleton
 
+if TYPE_CHECKING:
+    import msal
+
 logger: Logger = setup_logger()
 
 @singleton
 class GraphAuthenticator:
+    # L1 in-memory token cache keyed by (app_id, scopes), token_cache.json being the L2 cache
+    _L1: dict[tuple, dict] = {}
+    _L1_lock: threading.Lock = threading.Lock()
+
     def __init__(self, app_id: str, scopes: list[str]) -> None:
         self.SCOPES: list[str] = scopes
-        self.token_cache: msal.SerializableTokenCache = msal.SerializableTokenCache()
-
-        if os.path.exists("token_cache.json"):
-            with open("token_cache.json", "r") as f:
-                self.token_cache.deserialize(f.read())
-        
-        self.client = msal.PublicClientApplication(client_id=app_id, token_cache=self.token_cache)
+        self.token_cache: msal.SerializableTokenCache = None
+        self.client: msal.PublicClientApplication = None
         self.token: dict = self.generate_token(app_id, scopes)
 
     def generate_token(self, app_id: str, scopes: list[str]) -> dict:
-        self.token_cache = msal.SerializableTokenCache()
+        # Imported here as msal is slow to import and only needed once a token is requested
+        import msal
 
-        if os.path.exists("token_cache.json"):
-           self.token_cache.deserialize(open("token_cache.json", "r").read())
-        
-        client: msal.ClientApplication = msal.PublicClientApplication(client_id=app_id, token_cache=self.token_cache)
+        # Reuse the in-memory token while it is valid for more than a minute
+        key: tuple = (app_id, tuple(scopes))
+        with self._L1_lock:
+            cached: dict = self._L1.get(key)
+        if cached and cached["expires_at"] - time.time() > 60:
+            return cached["token"]
 
-        accounts: List[dict[str, Any]] = client.get_accounts()
+        # Load the token cache and build the client only once
+        if self.client is None:
+            self.token_cache = msal.SerializableTokenCache()
+
+            if os.path.exists("token_cache.json"):
+                with open("token_cache.json", "r") as f:
+                    self.token_cache.deserialize(f.read())
+
+            self.client = msal.PublicClientApplication(client_id=app_id, token_cache=self.token_cache)
+
+        accounts: List[dict[str, Any]] = self.client.get_accounts()
         if accounts:
-            token_response: dict = client.acquire_token_silent(scopes, account=accounts[0])
+            token_response: dict = self.client.acquire_token_silent(scopes, account=accounts[0])
         else:
-            flow: msal.PublicClientApplication = client.initiate_device_flow(scopes=scopes)
+            import pyperclip
+            import webbrowser
+
+            flow: msal.PublicClientApplication = self.client.initiate_device_flow(scopes=scopes)
             pyperclip.copy(flow["user_code"])
             webbrowser.open(flow["verification_uri"])
 
-            token_response: dict = client.acquire_token_by_device_flow(flow)
-        
-        with open("token_cache.json", "w") as f:
-            f.write(self.token_cache.serialize())
+            token_response: dict = self.client.acquire_token_by_device_flow(flow)
         
+        # Write the cache atomically so a crash mid-write cannot corrupt it
+        if self.token_cache.has_state_changed:
+            with open("token_cache.json.tmp", "w") as f:
+                f.write(self.token_cache.serialize())
+            os.replace("token_cache.json.tmp", "token_cache.json")
 
+        if token_response and "expires_in" in token_response:
+            with self._L1_lock:
+                self._L1[key] = {
+                    "token": token_response,
+                    "expires_at": time.time() + int(token_response["expires_in"])
+                }
 
         return token_response
 
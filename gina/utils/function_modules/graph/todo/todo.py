@@ -1,37 +1,95 @@
-import requests
+import time
+import asyncio
+from typing import TYPE_CHECKING
 from config.settings import Config
 from gina.decorators.singleton import singleton
 
+if TYPE_CHECKING:
+    import httpx
+
 @singleton
 class ToDo:
 
-    def __init__(self, access_token: dict) -> None:
+    def __init__(self, access_token: str | dict) -> None:
         self.BASE_ENDPOINT: str = Config.get_config_value("graph_endpoint") + "/me/todo"
-        self.ACCESS_TOKEN: dict = access_token
-        self.default_headers: dict = {
-            'Authorization': 'Bearer ' + self.ACCESS_TOKEN
-        }
-    
-    async def get_lists(self) -> dict[int, str]:
+
+        # Accept either the access token itself or the full MSAL token response
+        self.ACCESS_TOKEN: str = access_token if isinstance(access_token, str) else access_token['access_token']
+
+        self._client: "httpx.AsyncClient" = None
+        self._client_loop: asyncio.AbstractEventLoop = None  # the event loop the client is bound to
+        self._lists_cache: tuple[float, str, dict] | None = None  # (timestamp, etag, lists)
+        self.LISTS_CACHE_TTL: float = 60.0
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        # The client's connections belong to the loop that created it, a new asyncio.run needs a new client
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._client = None
+
+        # httpx is imported on first use to keep it off the startup path
+        if self._client is None:
+            import httpx
+
+            # Headers are set once on the client and sent with every request
+            self._client = httpx.AsyncClient(
+                headers={'Authorization': f'Bearer {self.ACCESS_TOKEN}'},
+                http2=True
+            )
+            self._client_loop = loop
+
+        return self._client
+
+    async def aclose(self) -> None:
+        # Close the shared client, to be awaited before the event loop using it shuts down
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def get_lists(self) -> dict[str, str]:
+        # Serve the lists from the cache while it is fresh
+        if self._lists_cache and time.monotonic() - self._lists_cache[0] < self.LISTS_CACHE_TTL:
+            return self._lists_cache[2]
+
         endpoint: str = self.BASE_ENDPOINT + "/lists"
-        
-        reponse: requests.Response = requests.get(endpoint, headers=self.default_headers)
 
-        lists: dict[str, int] = {}
+        # Revalidate the cached lists with their ETag
+        headers: dict = {}
+        if self._lists_cache and self._lists_cache[1]:
+            headers['If-None-Match'] = self._lists_cache[1]
+
+        response: httpx.Response = await self._get_client().get(endpoint, headers=headers or None)
+
+        if response.status_code == 304:
+            self._lists_cache = (time.monotonic(), self._lists_cache[1], self._lists_cache[2])
+            return self._lists_cache[2]
+
+        response.raise_for_status()
+        data: dict = response.json()
+        lists: dict[str, str] = {item['displayName']: item['id'] for item in data['value']}
+
+        self._lists_cache = (time.monotonic(), response.headers.get('ETag'), lists)
 
-        for list in reponse.json()['value']:
-            lists[list['displayName']] = list['id']
-        
         return lists
-    
+
     async def get_tasks(self, list_id: str) -> dict:
         endpoint: str = self.BASE_ENDPOINT + "/lists/" + list_id + "/tasks"
 
-        response: requests.Response = requests.get(endpoint, headers=self.default_headers)
+        response: httpx.Response = await self._get_client().get(endpoint)
+        response.raise_for_status()
 
         return response.json()['value']
-    
+
     async def get_tasks_with_name(self, list_name: str) -> dict:
-        # ToDO: Implement method to get tasks by list name instead of list id
-        pass
+        list_id: str = (await self.get_lists())[list_name]
+
+        return await self.get_tasks(list_id)
+
+    async def get_all_tasks(self) -> dict[str, dict]:
+        lists: dict[str, str] = await self.get_lists()
+
+        # Fetch the tasks of every list concurrently
+        tasks: list[dict] = await asyncio.gather(*(self.get_tasks(list_id) for list_id in lists.values()))
 
+        return dict(zip(lists.keys(), tasks))
@@ -1,22 +1,353 @@
 import os
 import time
+import random
+import io
 import html
-import json
+import mmap
 import base64
+import shutil
 import socket
+import itertools
 from logging import Logger
 import spotipy
 import requests
 import subprocess
 import webbrowser
 from gina.utils.logger import setup_logger
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv, set_key
+from gina.decorators import read_only
+from functools import lru_cache, wraps
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, Optional
+from dotenv import dotenv_values, set_key
 from spotipy.oauth2 import SpotifyOAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, parse_qs
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 logger: Logger = setup_logger()
 
+# OAuth scopes requested for every feature of the client, granted once at login
+_SCOPE = " ".join((
+    'user-read-playback-state', 'user-modify-playback-state', 'user-read-currently-playing',
+    'user-read-recently-played', 'playlist-modify-public', 'playlist-modify-private',
+    'ugc-image-upload', 'user-library-read', 'user-library-modify', 'user-top-read',
+    'user-read-private', 'user-read-email',
+))
+
+_PLAYBACK_TEMPLATE = (
+    "Device: {device_name} ({device_type}) - Volume: {volume_percent}%\n"
+    "Track: {track_name}\n"
+    "Artist: {artist_name}\n"
+    "Album: {album_name} - Released: {release_date}\n"
+    "Explicit: {explicit}\n"
+    "Popularity: {popularity}\n"
+    "Playback Position: {progress} / {duration}\n"
+    "Currently Playing: {is_playing}\n"
+    "Shuffle: {shuffle}\n"
+    "Repeat Mode: {repeat_state}\n"
+    "Track URL: {track_url}\n"
+)
+
+_PLAYLIST_TEMPLATE = (
+    "Playlist Name: {name}\n"
+    "Description: {description}\n"
+    "Followers: {followers}\n"
+    "Collaborative: {collaborative}\n"
+    "Public: {public}\n"
+    "Playlist URL: {playlist_url}\n"
+    "Owner: {owner_name} ({owner_url})\n"
+    "Image: {image_url}"
+)
+
+_TRACK_TEMPLATE = (
+    "Track Name: {name}\n"
+    "Artist: {artist_name}\n"
+    "Album: {album_name} - Released: {release_date}\n"
+    "Duration: {duration} (mm:ss)\n"
+    "Popularity: {popularity}\n"
+    "Explicit: {explicit}\n"
+    "Track URL: {track_url}\n"
+    "Image: {image_url}"
+)
+
+_ALBUM_TEMPLATE = (
+    "Album Name: {name}\n"
+    "Artist: {artist_name}\n"
+    "Release Date: {release_date}\n"
+    "Total Tracks: {total_tracks}\n"
+    "Album Type: {album_type}\n"
+    "Genres: {genres}\n"
+    "Label: {label}\n"
+    "Album URL: {album_url}\n"
+    "Image: {image_url}"
+)
+
+_ALBUM_TRACK_TEMPLATE = (
+    "Track: {name}\n"
+    "Artist: {artist_name}\n"
+    "Duration: {minutes}:{seconds:02}\n"
+    "Explicit: {explicit}\n"
+    "URL: {track_url}\n"
+)
+
+_AUDIO_FEATURES_TEMPLATE = (
+    "Acousticness: {acousticness:.3f}\n"
+    "Danceability: {danceability:.3f}\n"
+    "Energy: {energy:.3f}\n"
+    "Instrumentalness: {instrumentalness:.3f}\n"
+    "Liveness: {liveness:.3f}\n"
+    "Loudness: {loudness:.1f} dB\n"
+    "Speechiness: {speechiness:.3f}\n"
+    "Tempo: {tempo:.1f} BPM\n"
+    "Valence: {valence:.3f}\n"
+    "Key: {key}\n"
+    "Mode: {mode}"
+)
+
+_AUDIO_FEATURE_NAMES = (
+    'acousticness', 'danceability', 'energy', 'instrumentalness', 'liveness',
+    'loudness', 'speechiness', 'tempo', 'valence',
+)
+_audio_feature_values = itemgetter(*_AUDIO_FEATURE_NAMES)
+
+_playback_item_fields = itemgetter("name", "artists", "album", "duration_ms", "external_urls")
+
+# Upper bound on the pages fetched at the same time, to stay clear of Spotify's rate limits
+_MAX_PAGE_WORKERS = 8
+
+# Response fields requested from the playlist endpoints, limited to what the formatters read
+_PLAYLIST_FIELDS = "name,description,followers.total,collaborative,public,external_urls.spotify,owner(display_name,external_urls.spotify),images(url)"
+_PLAYLIST_ITEMS_FIELDS = "items(track(name,artists(name),album(name,external_urls.spotify),external_urls.spotify,duration_ms)),next,total"
+
+# Maximum number of items a playlist addition request accepts
+_ADD_BATCH_SIZE = 100
+
+# Maximum number of track IDs the saved-tracks check accepts per request
+_SAVED_CHECK_BATCH_SIZE = 50
+
+# Number of times a rate-limited (429) Spotify call is retried before giving up
+_RATE_LIMIT_RETRIES = 4
+
+# Longest Retry-After delay, in seconds, worth waiting for, longer ones give up with the error message
+_MAX_RETRY_AFTER = 30.0
+
+# Size of the chunks streamed into the base64 encoder, a multiple of 3 so no padding is emitted mid-stream
+_B64_CHUNK_SIZE = 48 * 1024
+
+# Field getters shared by the track listing loops
+_get_name = itemgetter("name")
+_get_artists = itemgetter("artists")
+_get_album = itemgetter("album")
+
+# Windows-only flags that detach the launched Spotify app from Gina's process, 0 elsewhere
+_DETACHED_FLAGS = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+
+# Delays, in seconds, between device probes while waiting for a freshly launched Spotify app
+_LAUNCH_BACKOFF = (0.5, 1.0, 2.0, 3.0)
+
+@lru_cache(maxsize=1)
+def _load_env() -> Dict[str, Optional[str]]:
+    """
+    Parses the .env file once and caches its values.
+
+    Call `_load_env.cache_clear()` to force the file to be read again.
+
+    Returns:
+    --------
+    dict:
+        The variables defined in the .env file.
+    """
+    return dotenv_values(".env")
+
+def _env(var_name: str) -> Optional[str]:
+    """
+    Fetches a variable from the cached .env values, falling back to the process environment.
+    """
+    return _load_env().get(var_name) or os.environ.get(var_name)
+
+@lru_cache(maxsize=1)
+def _hostname_lower() -> str:
+    """
+    Returns the computer's hostname in lowercase, looked up once.
+    """
+    return socket.gethostname().lower()
+
+@lru_cache(maxsize=1)
+def _current_username() -> str:
+    """
+    Returns the name of the logged in user, looked up once.
+    """
+    return os.getlogin()
+
+@lru_cache(maxsize=1)
+def _spotify_path() -> str:
+    """
+    Returns the path of the Spotify executable, resolved once.
+
+    Looks Spotify up on the PATH first, then falls back to its default installation
+    location on Windows.
+    """
+    on_path = shutil.which("Spotify")
+    if on_path:
+        return on_path
+
+    appdata = os.environ.get("APPDATA") or f"C:\\Users\\{_current_username()}\\AppData\\Roaming"
+    return os.path.join(appdata, "Spotify", "Spotify.exe")
+
+def _unescape(text: Optional[str]) -> Optional[str]:
+    """
+    Decodes HTML entities in a Spotify metadata string, skipping the work when there are none.
+    """
+    return html.unescape(text) if text and '&' in text else text
+
+def _dig(obj: Any, *keys: Any, default: Any = None) -> Any:
+    """
+    Walks nested dicts and lists along the given keys and indices, returning the default
+    as soon as a level is missing, empty or None.
+    """
+    for key in keys:
+        if isinstance(obj, dict):
+            obj = obj.get(key)
+        elif isinstance(obj, list) and isinstance(key, int) and -len(obj) <= key < len(obj):
+            obj = obj[key]
+        else:
+            return default
+
+        if obj is None:
+            return default
+
+    return obj
+
+def _b64encode_chunks(chunks: Iterable[bytes]) -> str:
+    """
+    Base64-encodes a stream of byte chunks incrementally, without buffering the whole input first.
+    """
+    encoded = io.BytesIO()
+    pending = bytearray()
+
+    for chunk in chunks:
+        pending += chunk
+
+        # Encode every complete 3-byte group, carrying the remainder to the next chunk
+        cut = len(pending) - len(pending) % 3
+        if cut:
+            encoded.write(base64.b64encode(pending[:cut]))
+            del pending[:cut]
+
+    encoded.write(base64.b64encode(pending))
+    return encoded.getvalue().decode("ascii")
+
+def _fmt_duration(duration_ms: int) -> str:
+    """
+    Formats a duration in milliseconds as minutes:seconds.
+    """
+    minutes, seconds = divmod(duration_ms // 1000, 60)
+    return f"{minutes}:{seconds:02}"
+
+def _fmt_album_track(track: Dict[str, Any]) -> str:
+    """
+    Formats one track of an album listing.
+    """
+    artists = track.get('artists')
+    minutes, seconds = divmod(track.get('duration_ms', 0) // 1000, 60)
+
+    return _ALBUM_TRACK_TEMPLATE.format(
+        name=track.get('name', 'Unknown Track'),
+        artist_name=artists[0].get('name', 'Unknown Artist') if artists else 'Unknown Artist',
+        minutes=minutes,
+        seconds=seconds,
+        explicit="Yes" if track.get("explicit", False) else "No",
+        track_url=track['external_urls'].get('spotify', 'No URL'),
+    )
+
+def _track_fields(track: Dict[str, Any]) -> tuple:
+    """
+    Extracts the name, artist, album, album URL and track URL of a track, binding each
+    nested object once.
+    """
+    artists = track.get('artists')
+    album = track.get('album') or {}
+
+    return (
+        track.get('name', 'Unknown Track'),
+        artists[0]['name'] if artists else 'Unknown Artist',
+        album['name'] if album else 'Unknown Album',
+        (album.get('external_urls') or {}).get('spotify', 'No Album URL'),
+        (track.get('external_urls') or {}).get('spotify', 'No URL'),
+    )
+
+def _fmt_playlist_track(track: Dict[str, Any]) -> str:
+    """
+    Formats one track of a playlist listing.
+    """
+    track_name, artist_name, album_name, album_url, track_url = _track_fields(track)
+
+    return (
+        f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, "
+        f"Album URL: {album_url}, Track URL: {track_url}"
+    )
+
+def _fmt_saved_track(track: Dict[str, Any]) -> str:
+    """
+    Formats one track of the user's saved tracks listing.
+    """
+    track_name, artist_name, album_name, album_url, track_url = _track_fields(track)
+    duration = _fmt_duration(track.get('duration_ms', 0))
+
+    return (
+        f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, "
+        f"Duration: {duration}, Album URL: {album_url}, Track URL: {track_url}"
+    )
+
+def _arg(args: Optional[Dict[str, Any]], key: str, default: Any = None) -> Any:
+    """
+    Fetches a tool argument, returning the default when no arguments were given.
+    """
+    return args.get(key, default) if args else default
+
+def _spotify_call(error_message: str):
+    """
+    Creates a decorator that retries a Spotify tool method when it is rate limited and
+    turns any other error into a logged error message.
+
+    Rate-limited calls wait for the `Retry-After` delay sent by Spotify, or an exponential
+    backoff when it is missing, plus some jitter.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except spotipy.SpotifyException as e:
+                    if e.http_status == 429 and attempt < _RATE_LIMIT_RETRIES:
+                        retry_after = (e.headers or {}).get('Retry-After')
+                        try:
+                            delay = float(retry_after) if retry_after else 2 ** attempt
+                        except ValueError:
+                            delay = 2 ** attempt
+
+                        # Spotify may ask to wait for hours, which would hang the whole turn
+                        if delay <= _MAX_RETRY_AFTER:
+                            delay += random.uniform(0, 0.5)
+                            logger.warning(f"Rate limited by Spotify, retrying {func.__name__} in {delay:.1f}s.")
+                            time.sleep(delay)
+                            attempt += 1
+                            continue
+                    error = e
+                except Exception as e:
+                    error = e
+
+                logger.error(f"{error_message}: {str(error)}")
+                return f"{error_message}."
+
+        return wrapper
+
+    return decorator
+
 class SpotifyClient:
 
     def __init__(self) -> None:
@@ -32,14 +363,11 @@ class SpotifyClient:
             If authentication fails.
         """
         try:
-            # Load environment variables from .env file
-            load_dotenv()
-
-            # Retrieve Spotify credentials from environment variables
-            client_id = os.getenv('SPOTIFY_CLIENT_ID')
-            client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
-            redirect_uri = os.getenv('SPOTIFY_REDIRECT_URI')
-            self.default_device_id = os.getenv('SPOTIFY_DEFAULT_DEVICE_ID')
+            # Retrieve Spotify credentials from the cached .env values
+            client_id = _env('SPOTIFY_CLIENT_ID')
+            client_secret = _env('SPOTIFY_CLIENT_SECRET')
+            redirect_uri = _env('SPOTIFY_REDIRECT_URI')
+            self.default_device_id = _env('SPOTIFY_DEFAULT_DEVICE_ID')
 
             # Ensure all required environment variables are loaded
             if not client_id or not client_secret or not redirect_uri:
@@ -50,19 +378,43 @@ class SpotifyClient:
                 client_id=client_id,
                 client_secret=client_secret,
                 redirect_uri=redirect_uri,
-                scope='user-read-playback-state user-modify-playback-state user-read-currently-playing user-read-recently-played playlist-modify-public playlist-modify-private ugc-image-upload user-library-read user-library-modify user-top-read user-read-private user-read-email',
+                scope=_SCOPE,
+                cache_handler=spotipy.CacheFileHandler(cache_path='.cache'),
             )
 
+            # Share one pooled session across all Spotify and image CDN calls so connections are kept alive
+            self._session = requests.Session()
+            self._session.mount('https://', HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                pool_block=False,
+                # Server errors are retried here, rate limits (429) by _spotify_call
+                max_retries=Retry(
+                    total=3,
+                    status=3,
+                    read=False,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+                ),
+            ))
+
             # Create an authenticated Spotify client
-            self.sp = spotipy.Spotify(auth_manager=self.auth_manager)
+            self.sp = spotipy.Spotify(auth_manager=self.auth_manager, requests_session=self._session)
+
+            # Short-lived cache of the available devices, as (fetch time, devices)
+            self._devices_cache: tuple[float, list] = (0.0, [])
+
+            # ID of the authenticated user, fetched on first use
+            self._me_id: Optional[str] = None
 
             # Fetch and save default device ID if not set
             if not self.default_device_id:
-                print("No default device ID found. Fetching available devices...")
+                logger.info("No default device ID found. Fetching available devices...")
                 self.default_device_id = self.fetch_default_device_id()
             
             self.auth()
-            print("SpotifyClient initialized successfully.")
+            logger.info("SpotifyClient initialized successfully.")
                 
         except Exception as e:
             logger.exception("Failed to initialize SpotifyClient: %s", e)
@@ -74,6 +426,12 @@ class SpotifyClient:
             self.token_info_callback = token_info_callback
             super().__init__(*args, **kwargs)
 
+        def log_message(self, format, *args):
+            """
+            Routes the per-request access log to the debug logger instead of stderr.
+            """
+            logger.debug("oauth-cb: " + format, *args)
+
         def do_GET(self):
             """
             Handles GET requests and retrieves access tokens for authentication.
@@ -82,8 +440,13 @@ class SpotifyClient:
             the Spotify OAuth manager. Calls a callback with token info if successful.
             """
             if self.path.startswith('/callback'):
+                code = parse_qs(urlparse(self.path).query).get('code', [None])[0]
+                if not code:
+                    logger.error("Invalid callback URL format.")
+                    self.send_error(400, "Invalid request format.")
+                    return
+
                 try:
-                    code = self.path.split('=')[1]
                     token_info = self.auth_manager.get_access_token(code)
                     self.token_info_callback(token_info)
 
@@ -93,101 +456,78 @@ class SpotifyClient:
                     self.end_headers()
                     self.wfile.write(b'Authentication successful! You can close this window now.')
                 
-                except IndexError:
-                    logger.error("Invalid callback URL format.")
-                    self.send_error(400, "Invalid request format.")
-                
                 except Exception as e:
                     logger.exception("Unexpected error during authentication callback. %s", e)
                     self.send_error(500, "Internal server error.")
 
-    def load_cached_token(self, cache_path: str = '.cache') -> Optional[Dict[str, Any]]:
+    def auth(self):
         """
-        Loads token information from a cache file, if available.
+        Authenticates the user with Spotify.
 
-        Parameters:
-        -----------
-        cache_path : str
-            Path to the cache file containing token information. Default is '.cache'.
-
-        Returns:
-        --------
-        dict or None:
-            A dictionary containing token information if the file is read successfully,
-            None if the file is not found or if there is an error reading the file.
+        A cached token is checked first. Only when none is found is the interactive callback
+        flow run, blocking until the user has authorized the application. No event loop is
+        involved, so this also works when called inside a running loop.
 
         Raises:
         -------
-        IOError:
-            If there is an error opening or reading the file, excluding FileNotFoundError.
+        Exception:
+            Any error during the authentication process.
         """
         try:
-            with open(cache_path, 'r') as f:
-                token_info = json.load(f)
-                logger.debug(
-                    f"Token information successfully loaded from '{cache_path}'."
-                )
-                return token_info
-
-        except FileNotFoundError:
-            logger.warning(f"Cache file '{cache_path}' not found. Returning None.")
-            return None
-
-        except json.JSONDecodeError:
-            logger.error(f"Cache file '{cache_path}' is not valid JSON. Returning None.")
-            return None
-
-        except IOError as e:
-            logger.exception(f"Error reading cache file '{cache_path}': {e}")
+            if not self._load_cached_token():
+                self._authorize_interactively()
+        except Exception as e:
+            logger.exception("Error during authentication: %s", e)
             raise
 
-    def auth(self):
+    def _load_cached_token(self) -> bool:
         """
-        Authenticates the user with Spotify, opening the authorization URL in a web browser
-        if no cached token is found. The HTTP server listens for a response containing the
-        authorization code, which is used to obtain an access token.
+        Loads the token from the cache, refreshing it if it has expired.
 
-        Raises:
-        -------
-        Exception:
-            Any error during the authentication process.
+        Returns:
+        --------
+        bool:
+            True if a usable cached token was found.
         """
-        try:
-            # Define a token handling function to store the received token info
-            def handle_token(token_info):
-                self.token_info = token_info
+        self.token_info = self.auth_manager.validate_token(self.auth_manager.cache_handler.get_cached_token())
 
-            # Attempt to load token from cache
-            self.token_info = self.load_cached_token()
+        if self.token_info is None:
+            return False
 
-            # If no cached token is found, start the authentication flow
-            if self.token_info is None:
-                logger.debug("No cached token found, initiating new authentication flow.")
+        logger.debug("Cached token found, skipping authentication.")
+        return True
 
-                # Start HTTP server to listen for callback
-                httpd = HTTPServer(('localhost', 8888), lambda *args, **kwargs: 
-                                self.WebHandler(self.auth_manager, handle_token, *args, **kwargs))
-
-                # Generate the authorization URL and open it in the user's browser
-                try:
-                    auth_url = self.auth_manager.get_authorize_url()
-                    webbrowser.open(auth_url)
-                    logger.debug("Opened browser for user authentication.")
-                except Exception as browser_error:
-                    logger.error(f"Failed to open browser for authentication: {browser_error}")
-                    raise
+    def _authorize_interactively(self) -> None:
+        """
+        Opens the authorization URL in a web browser and listens with an HTTP server for the
+        response containing the authorization code, which is used to obtain an access token.
+        """
+        # Define a token handling function to store the received token info
+        def handle_token(token_info):
+            self.token_info = token_info
 
-                # Handle the incoming request to capture the authorization response
-                print("Waiting for user to authorize application...")
-                httpd.handle_request()
-                print("Authorization process completed.")
+        logger.debug("No cached token found, initiating new authentication flow.")
 
-            else:
-                print("Cached token found, skipping authentication.")
+        # Start HTTP server to listen for callback
+        httpd = HTTPServer(('localhost', 8888), lambda *args, **kwargs: 
+                        self.WebHandler(self.auth_manager, handle_token, *args, **kwargs))
 
-        except Exception as e:
-            logger.exception("Error during authentication: %s", e)
-            raise
+        try:
+            # Generate the authorization URL and open it in the user's browser
+            try:
+                auth_url = self.auth_manager.get_authorize_url()
+                webbrowser.open(auth_url)
+                logger.debug("Opened browser for user authentication.")
+            except Exception as browser_error:
+                logger.error(f"Failed to open browser for authentication: {browser_error}")
+                raise
+
+            # Handle the incoming request to capture the authorization response
+            logger.info("Waiting for user to authorize application...")
+            httpd.handle_request()
+            logger.info("Authorization process completed.")
+        finally:
+            httpd.server_close()
     
     def player(func):
         func._is_player_function = True
@@ -217,6 +557,111 @@ class SpotifyClient:
         func._is_custom_function = True
         return func
 
+    def _devices(self) -> list:
+        """
+        Returns the available Spotify devices, reusing the last result for up to 2 seconds.
+
+        Returns:
+        --------
+        list:
+            The devices as returned by the Spotify API.
+        """
+        now = time.monotonic()
+        if now - self._devices_cache[0] < 2.0:
+            return self._devices_cache[1]
+
+        devices = self.sp.devices().get('devices', [])
+        self._devices_cache = (now, devices)
+        return devices
+
+    def _wait_for_devices(self) -> list:
+        """
+        Polls the available devices with an increasing delay until at least one appears.
+
+        Returns:
+        --------
+        list:
+            The devices found, or an empty list if none appeared before the backoff ran out.
+        """
+        for delay in _LAUNCH_BACKOFF:
+            time.sleep(delay)
+
+            # An empty list must not be served from the cache while waiting
+            self._devices_cache = (0.0, [])
+            devices = self._devices()
+            if devices:
+                return devices
+
+        return []
+
+    def _current_user_id(self) -> str:
+        """
+        Returns the ID of the authenticated user, fetching it from Spotify only once.
+
+        Returns:
+        --------
+        str:
+            The current user's Spotify ID.
+        """
+        if self._me_id is None:
+            self._me_id = self.sp.me()['id']
+        return self._me_id
+
+    @_spotify_call("Error adding item to playlist")
+    def _add_playlist_batch(self, playlist_id: str, uris: List[str]) -> Optional[str]:
+        """
+        Adds a single batch of at most 100 items to a playlist.
+
+        Rate-limited batches are retried on their own, so the batches already sent are not added twice.
+
+        Returns:
+        --------
+        None on success, or an error message.
+        """
+        self.sp.playlist_add_items(playlist_id, uris)
+
+    def _paginate(self, fetch: Callable[[int, int], dict], offset: int, page_size: int, end: Optional[int] = None) -> List[dict]:
+        """
+        Fetches a paginated Spotify listing, requesting every page after the first concurrently.
+
+        The first page is fetched on its own to learn the total number of items, then the
+        remaining offsets are dispatched to a bounded thread pool since spotipy is synchronous.
+
+        Parameters:
+        -----------
+        fetch : Callable[[int, int], dict]
+            Function taking an offset and a limit and returning one page of the listing.
+        offset : int
+            Offset of the first item to fetch.
+        page_size : int
+            Number of items requested per page.
+        end : int, optional
+            Offset at which to stop. Defaults to the total reported by the first page.
+
+        Returns:
+        --------
+        list:
+            The pages fetched, in order. Empty if the first page had no response.
+        """
+        first_page = fetch(offset, page_size if end is None else min(page_size, end - offset))
+        if not first_page or not first_page.get('items'):
+            return [first_page] if first_page else []
+
+        # Spotify sets 'next' to null on the last page, no need to look at the total then
+        if not first_page.get('next'):
+            return [first_page]
+
+        total = first_page.get('total', 0)
+        stop = total if end is None else min(end, total)
+        offsets = range(offset + page_size, stop, page_size)
+        if not offsets:
+            return [first_page]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, len(offsets))) as executor:
+            pages = list(executor.map(lambda page_offset: fetch(page_offset, min(page_size, stop - page_offset)), offsets))
+
+        return [first_page, *pages]
+
     @custom
     def fetch_default_device_id(self) -> str:
         """
@@ -235,32 +680,39 @@ class SpotifyClient:
         """
         try:
             # Get the computer's hostname in lowercase
-            computer_name = socket.gethostname().lower()
+            computer_name = _hostname_lower()
             
             # Fetch available devices
-            devices = self.sp.devices().get('devices', [])
+            devices = self._devices()
             
             # Retry with Spotify app launch if no devices found
             if not devices:
                 logger.warning("No devices found. Launching Spotify app and retrying.")
                 self.launch_spotify_app()
-                time.sleep(5)  # Adjust delay as needed
-                devices = self.sp.devices().get('devices', [])
-
-            # Search for a device that matches the computer's hostname, case-insensitively
-            for device in devices:
-                if device['name'].lower() == computer_name:
-                    default_device_id = device['id']
-                    set_key(".env", "SPOTIFY_DEFAULT_DEVICE_ID", default_device_id)
-                    print(f"Default device ID found and saved: {default_device_id}")
-                    return default_device_id
-
-            raise Exception("No matching device found for this computer.")
+                devices = self._wait_for_devices()
+
+            # Look up the device matching the computer's hostname, case-insensitively,
+            # falling back to the hostname without its domain
+            devices_by_name = {device['name'].lower(): device['id'] for device in devices}
+            default_device_id = devices_by_name.get(computer_name) or devices_by_name.get(computer_name.split('.')[0])
+
+            if not default_device_id:
+                raise Exception("No matching device found for this computer.")
+
+            # Only rewrite .env when the saved device actually changed, keeping the cached values in sync
+            env = _load_env()
+            if env.get("SPOTIFY_DEFAULT_DEVICE_ID") != default_device_id:
+                set_key(".env", "SPOTIFY_DEFAULT_DEVICE_ID", default_device_id)
+                env["SPOTIFY_DEFAULT_DEVICE_ID"] = default_device_id
+                logger.info(f"Default device ID found and saved: {default_device_id}")
+
+            return default_device_id
             
         except Exception as e:
             logger.error(f"Error fetching default device ID: {e}")
             raise
 
+    @read_only
     @player
     def fetch_available_devices(self, args = None) -> str:
         """
@@ -282,7 +734,7 @@ class SpotifyClient:
             If there is an error retrieving devices.
         """
         try:
-            result = self.sp.devices()
+            result = {'devices': self._devices()}
             logger.info("Fetched available Spotify devices")
             return f"Result: {result}"
         except Exception as e:
@@ -290,6 +742,7 @@ class SpotifyClient:
             logger.error(error_message)
             return "Error fetching available devices."
 
+    @read_only
     @player
     def fetch_playback_state(self, args: dict = None) -> str:
         """
@@ -314,7 +767,6 @@ class SpotifyClient:
             # Retrieve current playback information from Spotify
             playback_info: dict = self.sp.current_playback()
             if playback_info:
-                print(type(playback_info))
                 if not playback_info.get('item'):
                     logger.info("No active playback found.")
                     return "No active playback."
@@ -323,59 +775,40 @@ class SpotifyClient:
                 return "No active playback."
 
             # Extract main playback details
-            track_name = playback_info['item']['name']
-            artist_name = playback_info['item']['artists'][0]['name']
-            album_name = playback_info['item']['album']['name']
-            is_playing = playback_info['is_playing']
-            progress_ms = playback_info['progress_ms']
-            duration_ms = playback_info['item']['duration_ms']
-
-            # Additional details from device
-            device_info = playback_info.get('device', {})
-            device_name = device_info.get('name', 'Unknown Device')
-            device_type = device_info.get('type', 'Unknown Type')
-            volume_percent = device_info.get('volume_percent', 'Unknown Volume')
-
-            # Playback controls
-            shuffle_state = playback_info.get('shuffle_state', False)
-            repeat_state = playback_info.get('repeat_state', 'off')
+            item = playback_info['item']
+            track_name, artists, album, duration_ms, external_urls = _playback_item_fields(item)
+            device_info = playback_info.get('device') or {}
 
             # Context information
-            context_info = playback_info.get('context', {})
+            context_type, context_url = None, None
+            context_info = playback_info.get('context')
             if context_info:
                 context_type = context_info.get('type', 'Unknown')
-                context_url = context_info.get('external_urls', {}).get('spotify', 'N/A')
+                context_url = _dig(context_info, 'external_urls', 'spotify', default='N/A')
 
-            # Additional track details
-            is_explicit = playback_info['item'].get('explicit', False)
-            popularity = playback_info['item'].get('popularity', 'Unknown')
-            track_url = playback_info['item']['external_urls'].get('spotify', 'No Track URL')
-            release_date = playback_info['item']['album'].get('release_date', 'Unknown Release Date')
-
-            # Format progress and duration from milliseconds to minutes:seconds
-            progress = f"{progress_ms // 60000}:{(progress_ms // 1000) % 60:02}"
-            duration = f"{duration_ms // 60000}:{(duration_ms // 1000) % 60:02}"
+            progress_ms = playback_info['progress_ms']
 
             # Format the result string with all the details
-            result_str = (
-                f"Device: {device_name} ({device_type}) - Volume: {volume_percent}%\n"
-                f"Track: {track_name}\n"
-                f"Artist: {artist_name}\n"
-                f"Album: {album_name} - Released: {release_date}\n"
-                f"Explicit: {'Yes' if is_explicit else 'No'}\n"
-                f"Popularity: {popularity}\n"
-                f"Playback Position: {progress} / {duration}\n"
-                f"Currently Playing: {'Yes' if is_playing else 'No'}\n"
-                f"Shuffle: {'On' if shuffle_state else 'Off'}\n"
-                f"Repeat Mode: {repeat_state}\n"
-                f"Track URL: {track_url}\n"
-            )
-
-            try:
-                if context_type:
-                    result_str += f"Context: {context_type} - {context_url}\n"
-            except NameError:
-                pass
+            result_str = _PLAYBACK_TEMPLATE.format_map({
+                'device_name': device_info.get('name', 'Unknown Device'),
+                'device_type': device_info.get('type', 'Unknown Type'),
+                'volume_percent': device_info.get('volume_percent', 'Unknown Volume'),
+                'track_name': track_name,
+                'artist_name': artists[0]['name'],
+                'album_name': album['name'],
+                'release_date': album.get('release_date', 'Unknown Release Date'),
+                'explicit': 'Yes' if item.get('explicit', False) else 'No',
+                'popularity': item.get('popularity', 'Unknown'),
+                'progress': _fmt_duration(progress_ms),
+                'duration': _fmt_duration(duration_ms),
+                'is_playing': 'Yes' if playback_info['is_playing'] else 'No',
+                'shuffle': 'On' if playback_info.get('shuffle_state', False) else 'Off',
+                'repeat_state': playback_info.get('repeat_state', 'off'),
+                'track_url': external_urls.get('spotify', 'No Track URL'),
+            })
+
+            if context_type:
+                result_str += f"Context: {context_type} - {context_url}\n"
 
             logger.info("Playback information retrieved successfully.")
             return result_str
@@ -400,12 +833,16 @@ class SpotifyClient:
             A message indicating success or failure of transferring playback.
         """
         try:
-            device_id = args.get("device_id") if args else None
+            device_id = _arg(args, "device_id")
             if not device_id:
                 logger.warning("Device ID not provided for transfer playback.")
                 return "Device ID is required to transfer playback."
 
             self.sp.transfer_playback(device_id)
+
+            # The active device changed, the cached devices are stale
+            self._devices_cache = (0.0, [])
+
             result_message = "Transferred Spotify Playback"
             logger.info(result_message)
             return result_message
@@ -430,19 +867,23 @@ class SpotifyClient:
             If there is an error launching the app.
         """
         try:
-            # Path to Spotify's default installation location on Windows
-            spotify_path = "C:\\Users\\{USERNAME}\\AppData\\Roaming\\Spotify\\Spotify.exe"
-
-            # Replace {USERNAME} with the current user's name
-            spotify_path = spotify_path.replace("{USERNAME}", os.getlogin())
-
-            # Attempt to launch Spotify
-            subprocess.Popen(spotify_path)
+            # Path to the Spotify executable
+            spotify_path = _spotify_path()
+
+            # Attempt to launch Spotify, detached so it outlives Gina and does not share its console
+            subprocess.Popen(
+                [spotify_path],
+                close_fds=True,
+                creationflags=_DETACHED_FLAGS,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             logger.info("Spotify app launched successfully.")
             return "Spotify app launched successfully."
 
         except FileNotFoundError:
-            error_message = "Spotify app not found at the default location."
+            error_message = "Spotify app not found on the PATH or at the default location."
             logger.error(error_message)
             return error_message
 
@@ -475,8 +916,8 @@ class SpotifyClient:
         """
         try:
             # Extract URIs or context URI
-            uris = args.get("uris") if args and "uris" in args else None
-            context_uri = args.get("context_uri") if args and "context_uri" in args else None
+            uris = _arg(args, "uris")
+            context_uri = _arg(args, "context_uri")
 
             # Attempt to start playback using Spotify API
             result = self.sp.start_playback(uris=uris, context_uri=context_uri)
@@ -507,11 +948,16 @@ class SpotifyClient:
                     launch_result = self.launch_spotify_app()
                     logger.info(f"Spotify app launch result: {launch_result}")
 
-                    # Retry with a few attempts and delay
-                    for attempt in range(1, 4):
-                        logger.info(f"Attempt {attempt}: Retrying after launching Spotify app...")
-                        time.sleep(3)
+                    # Retry with an increasing delay, only once the device has shown up
+                    for attempt, delay in enumerate(_LAUNCH_BACKOFF, start=1):
+                        time.sleep(delay)
+
+                        self._devices_cache = (0.0, [])
+                        if not self._devices():
+                            logger.debug(f"Attempt {attempt}: no device available yet.")
+                            continue
 
+                        logger.info(f"Attempt {attempt}: Retrying after launching Spotify app...")
                         try:
                             result = self.sp.start_playback(uris=uris, context_uri=context_uri, device_id=self.default_device_id)
                             if result is None:
@@ -587,7 +1033,7 @@ class SpotifyClient:
     @player
     def seek_to_position(self, args = None) -> str:
         try:
-            position_ms = args.get("position_ms") if args else None
+            position_ms = _arg(args, "position_ms")
             result = self.sp.seek_track(position_ms)
             if result is None:
                 result_message = f"Seeked to {position_ms} ms in current Spotify track"
@@ -601,7 +1047,7 @@ class SpotifyClient:
     @player
     def set_repeat_mode(self, args = None) -> str:
         try:
-            state = args.get("state") if args else None
+            state = _arg(args, "state")
             result = self.sp.repeat(state)
             if result is None:
                 result_message = f"Set repeat mode to {state} on Spotify"
@@ -615,7 +1061,7 @@ class SpotifyClient:
     @player
     def set_playback_volume(self, args = None) -> str:
         try:
-            volume_percent = args.get("volume_percent") if args else None
+            volume_percent = _arg(args, "volume_percent")
             result = self.sp.volume(volume_percent)
             if result is None:
                 result_message = f"Set playback volume to {volume_percent}% on Spotify"
@@ -629,7 +1075,7 @@ class SpotifyClient:
     @player
     def toggle_playlist_shuffle(self, args = None) -> str:
         try:
-            state = args.get("state") if args else None
+            state = _arg(args, "state")
             result = self.sp.shuffle(state)
             if result is None:
                 result_message = f"Shuffle state set to {state} on Spotify"
@@ -640,69 +1086,53 @@ class SpotifyClient:
             logger.error(error_message)
             return error_message
 
+    @read_only
     @player
+    @_spotify_call("Error getting recently played tracks")
     def get_recently_played_tracks(self, args = None) -> str:
-        try:
-            limit = args.get("limit", 50) if args else 50
-            recently_played_info = self.sp.current_user_recently_played(limit=limit)
-            if not recently_played_info or not recently_played_info.get('items'):
-                logger.info("No recently played tracks found on Spotify.")
-                return "No recently played tracks."
-
-            recently_played_tracks_info = []
-            for item in recently_played_info['items']:
-                track = item['track']
-                track_name = track['name']
-                artist_name = track['artists'][0]['name']
-                album_name = track['album']['name']
-                played_at = item['played_at']
-                recently_played_tracks_info.append(
-                    f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, Played At: {played_at}"
-                )
-
-            result_str = '\n'.join(recently_played_tracks_info)
-            logger.info("Fetched Recently Played Spotify Tracks")
-            return result_str
-        except Exception as e:
-            logger.error(f"Error getting recently played tracks: {str(e)}")
-            return "Error getting recently played tracks."
-
+        limit = _arg(args, "limit", 50)
+        recently_played_info = self.sp.current_user_recently_played(limit=limit)
+        if not recently_played_info or not recently_played_info.get('items'):
+            logger.info("No recently played tracks found on Spotify.")
+            return "No recently played tracks."
+
+        result_str = '\n'.join(
+            f"Track: {_get_name(track)}, Artist: {_get_name(_get_artists(track)[0])}, "
+            f"Album: {_get_name(_get_album(track))}, Played At: {item['played_at']}"
+            for item, track in ((item, item['track']) for item in recently_played_info['items'])
+        )
+        logger.info("Fetched Recently Played Spotify Tracks")
+        return result_str
+
+    @read_only
     @player
+    @_spotify_call("Error getting user queue")
     def get_user_queue(self, args = None) -> str:
-        try:
-            queue_info = self.sp.queue()
-            if not queue_info or not queue_info.get('items'):
-                logger.info("No items in the Spotify queue.")
-                return "No items in the queue."
-
-            queue_tracks_info = []
-            for track in queue_info['items']:
-                track_name = track['name']
-                artist_name = track['artists'][0]['name']
-                album_name = track['album']['name']
-                queue_tracks_info.append(f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}")
-
-            result_str = '\n'.join(queue_tracks_info)
-            logger.info("Fetched Current Spotify Queue")
-            return result_str
-        except Exception as e:
-            logger.error(f"Error getting user queue: {str(e)}")
-            return "Error getting user queue."
+        queue_info = self.sp.queue()
+        if not queue_info or not queue_info.get('items'):
+            logger.info("No items in the Spotify queue.")
+            return "No items in the queue."
+
+        result_str = '\n'.join(
+            f"Track: {_get_name(track)}, Artist: {_get_name(_get_artists(track)[0])}, Album: {_get_name(_get_album(track))}"
+            for track in queue_info['items']
+        )
+        logger.info("Fetched Current Spotify Queue")
+        return result_str
 
     @player
+    @_spotify_call("Error adding item to playback queue")
     def add_item_to_playback_queue(self, args = None) -> str:
-        try:
-            uri = args.get("uri") if args else None
-            result = self.sp.add_to_queue(uri)
-            if result is None:
-                result_message = f"Added the song {uri} to the playback queue"
-                logger.info(result_message)
-                return result_message
-        except Exception as e:
-            logger.error(f"Error adding item to playback queue: {str(e)}")
-            return "Error adding item to playback queue."
+        uri = _arg(args, "uri")
+        result = self.sp.add_to_queue(uri)
+        if result is None:
+            result_message = f"Added the song {uri} to the playback queue"
+            logger.info(result_message)
+            return result_message
     
+    @read_only
     @search
+    @_spotify_call("Error searching")
     def search_track(self, args = None) -> str:
         """
         Searches for tracks, artists, and albums on Spotify based on the provided query with optional filters.
@@ -720,54 +1150,48 @@ class SpotifyClient:
         str:
             Formatted search results or a message if no results are found.
         """
-        try:
-            base_query = args.get('q', "") if args else ""
-            filters = args.get('filters', {})
-            limit = args.get('limit', 10)
-            search_type = args.get("type", "track,artist,album")
-
-            # Add filters to the base query
-            for key, value in filters.items():
-                base_query += f" {key}:{value}"
-
-            result = self.sp.search(q=base_query, limit=limit, type=search_type)
-            
-            output = []
-
-            # Tracks
-            if 'tracks' in result and result['tracks']['items']:
-                output.append("Tracks:")
-                for track in result['tracks']['items']:
-                    track_name = track['name']
-                    artist_name = track['artists'][0]['name']
-                    album_name = track['album']['name']
-                    track_url = track['external_urls']['spotify']
-                    output.append(f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, URL: {track_url}")
-
-            # Artists
-            if 'artists' in result and result['artists']['items']:
-                output.append("\nArtists:")
-                for artist in result['artists']['items']:
-                    artist_name = artist['name']
-                    artist_url = artist['external_urls']['spotify']
-                    output.append(f"Artist: {artist_name}, URL: {artist_url}")
-
-            # Albums
-            if 'albums' in result and result['albums']['items']:
-                output.append("\nAlbums:")
-                for album in result['albums']['items']:
-                    album_name = album['name']
-                    artist_name = album['artists'][0]['name']
-                    album_url = album['external_urls']['spotify']
-                    output.append(f"Album: {album_name}, Artist: {artist_name}, URL: {album_url}")
-
-            return '\n'.join(output) if output else "No results found."
-
-        except Exception as e:
-            logger.error(f"Error searching: {str(e)}")
-            return "Error searching."
+        filters = _arg(args, 'filters', {})
+        limit = int(_arg(args, 'limit', 10))
+        search_type = _arg(args, "type", "track,artist,album")
+
+        # Join the base query and its filters in one pass, skipping empty parts
+        parts = [_arg(args, 'q', "")] + [f"{key}:{value}" for key, value in filters.items()]
+        query = " ".join(part for part in parts if part)
+
+        result = self.sp.search(q=query, limit=limit, type=search_type)
+
+        # Only the requested categories are formatted
+        wanted = {part.strip() for part in search_type.split(',')}
+        sections = []
+
+        # Tracks
+        if 'track' in wanted and 'tracks' in result and result['tracks']['items']:
+            sections.append("Tracks:\n" + '\n'.join(
+                f"Track: {_get_name(track)}, Artist: {_get_name(_get_artists(track)[0])}, "
+                f"Album: {_get_name(_get_album(track))}, URL: {track['external_urls']['spotify']}"
+                for track in result['tracks']['items']
+            ))
+
+        # Artists
+        if 'artist' in wanted and 'artists' in result and result['artists']['items']:
+            sections.append("\nArtists:\n" + '\n'.join(
+                f"Artist: {_get_name(artist)}, URL: {artist['external_urls']['spotify']}"
+                for artist in result['artists']['items']
+            ))
+
+        # Albums
+        if 'album' in wanted and 'albums' in result and result['albums']['items']:
+            sections.append("\nAlbums:\n" + '\n'.join(
+                f"Album: {_get_name(album)}, Artist: {_get_name(_get_artists(album)[0])}, "
+                f"URL: {album['external_urls']['spotify']}"
+                for album in result['albums']['items']
+            ))
+
+        return '\n'.join(sections) if sections else "No results found."
     
+    @read_only
     @playlists
+    @_spotify_call("Error fetching playlist")
     def get_playlist(self, args=None) -> str:
         """
         Retrieves and formats essential information from a Spotify playlist.
@@ -783,44 +1207,28 @@ class SpotifyClient:
         str:
             Formatted playlist information or an error message.
         """
-        try:
-            playlist_id = args.get("playlist_id") if args else None
-            if not playlist_id:
-                return "Playlist ID is required."
-
-            # Fetch playlist info
-            playlist_info = self.sp.playlist(playlist_id)
-
-            # Extract relevant information and decode any HTML entities
-            name = html.unescape(playlist_info.get("name", "Unknown"))
-            description = html.unescape(playlist_info.get("description", "No description available"))
-            followers = playlist_info.get("followers", {}).get("total", 0)
-            collaborative = "Yes" if playlist_info.get("collaborative", False) else "No"
-            public = "Yes" if playlist_info.get("public", False) else "No"
-            playlist_url = playlist_info.get("external_urls", {}).get("spotify", "No URL available")
-            owner_name = html.unescape(playlist_info.get("owner", {}).get("display_name", "Unknown"))
-            owner_url = playlist_info.get("owner", {}).get("external_urls", {}).get("spotify", "No URL available")
-            image_url = playlist_info.get("images", [{}])[0].get("url", "No image available")
-
-            # Base playlist information
-            result_str = (
-                f"Playlist Name: {name}\n"
-                f"Description: {description}\n"
-                f"Followers: {followers}\n"
-                f"Collaborative: {collaborative}\n"
-                f"Public: {public}\n"
-                f"Playlist URL: {playlist_url}\n"
-                f"Owner: {owner_name} ({owner_url})\n"
-                f"Image: {image_url}"
-            )
-
-            return result_str
-
-        except Exception as e:
-            logger.error(f"Error fetching playlist: {str(e)}")
-            return "Error fetching playlist."
+        playlist_id = _arg(args, "playlist_id")
+        if not playlist_id:
+            return "Playlist ID is required."
+
+        # Fetch playlist info
+        playlist_info = self.sp.playlist(playlist_id, fields=_PLAYLIST_FIELDS)
+
+        # Extract relevant information, decoding any HTML entities, and fill in the template
+        return _PLAYLIST_TEMPLATE.format_map({
+            'name': _unescape(playlist_info.get("name", "Unknown")),
+            'description': _unescape(playlist_info.get("description", "No description available")),
+            'followers': _dig(playlist_info, "followers", "total", default=0),
+            'collaborative': "Yes" if playlist_info.get("collaborative", False) else "No",
+            'public': "Yes" if playlist_info.get("public", False) else "No",
+            'playlist_url': _dig(playlist_info, "external_urls", "spotify", default="No URL available"),
+            'owner_name': _unescape(_dig(playlist_info, "owner", "display_name", default="Unknown")),
+            'owner_url': _dig(playlist_info, "owner", "external_urls", "spotify", default="No URL available"),
+            'image_url': _dig(playlist_info, "images", 0, "url", default="No image available"),
+        })
 
     @playlists
+    @_spotify_call("Error changing playlist details")
     def change_playlist_details(self, args=None) -> str:
         """
         Changes details of a Spotify playlist.
@@ -840,24 +1248,21 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            if not args or not args.get("playlist_id"):
-                return "Playlist ID is required."
-
-            self.sp.playlist_change_details(
-                playlist_id=args.get("playlist_id"),
-                name=args.get("name"),
-                description=args.get("description"),
-                public=args.get("public"),
-                collaborative=args.get("collaborative")
-            )
-            return "Playlist details updated successfully."
-
-        except Exception as e:
-            logger.error(f"Error changing playlist details: {str(e)}")
-            return "Error changing playlist details."
+        if not _arg(args, "playlist_id"):
+            return "Playlist ID is required."
+
+        self.sp.playlist_change_details(
+            playlist_id=args.get("playlist_id"),
+            name=args.get("name"),
+            description=args.get("description"),
+            public=args.get("public"),
+            collaborative=args.get("collaborative")
+        )
+        return "Playlist details updated successfully."
         
+    @read_only
     @playlists
+    @_spotify_call("Error retrieving playlist items")
     def get_playlist_items(self, args=None) -> str:
         """
         Retrieves items (tracks) from a Spotify playlist.
@@ -875,75 +1280,66 @@ class SpotifyClient:
         str:
             Playlist items information or an error message.
         """
-        try:
-            playlist_id = args.get("playlist_id") if args else None
-            limit = args.get("limit", 100)
-            offset = args.get("offset", 0)
-
-            if not playlist_id:
-                return "Playlist ID is required."
-
-            # Fetch playlist items
-            items = self.sp.playlist_items(playlist_id, limit=limit, offset=offset)
-
-            # Check if items are present
-            if not items or 'items' not in items or len(items['items']) == 0:
-                return "No items found in the playlist."
-
-            # Format track information
-            tracks_info = []
-            for item in items['items']:
-                track = item.get('track')
-                if track:
-                    track_name = track.get('name', 'Unknown Track')
-                    artist_name = track['artists'][0]['name'] if track.get('artists') else 'Unknown Artist'
-                    album_name = track['album']['name'] if track.get('album') else 'Unknown Album'
-                    album_url = track['album']['external_urls']['spotify'] if track.get('album') and track['album'].get('external_urls') else 'No Album URL'
-                    track_url = track['external_urls']['spotify'] if track.get('external_urls') else 'No URL'
-                    
-                    tracks_info.append(
-                        f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, "
-                        f"Album URL: {album_url}, Track URL: {track_url}"
-                    )
-
-            return '\n'.join(tracks_info)
+        playlist_id = _arg(args, "playlist_id")
+        limit = _arg(args, "limit", 100)
+        offset = _arg(args, "offset", 0)
 
-        except Exception as e:
-            logger.error(f"Error retrieving playlist items: {str(e)}")
-            return "Error retrieving playlist items."
+        if not playlist_id:
+            return "Playlist ID is required."
+
+        # Fetch playlist items, in concurrent pages of at most 100 when more are requested
+        pages = self._paginate(
+            lambda page_offset, page_limit: self.sp.playlist_items(playlist_id, fields=_PLAYLIST_ITEMS_FIELDS, limit=page_limit, offset=page_offset),
+            offset, min(limit, 100), end=offset + limit,
+        )
+        items = [item for page in pages if page for item in page.get('items') or []]
+
+        # Check if items are present
+        if not items:
+            return "No items found in the playlist."
+
+        # Format track information
+        return '\n'.join(_fmt_playlist_track(item['track']) for item in items if item.get('track'))
 
     @playlists
+    @_spotify_call("Error adding item to playlist")
     def add_item_to_playlist(self, args=None) -> str:
         """
-        Adds an item (track) to a Spotify playlist.
+        Adds one or more items (tracks) to a Spotify playlist.
 
         Parameters:
         -----------
         args : dict, optional
             Dictionary containing:
-                - 'playlist_id' (str): ID of the playlist to add the item to.
-                - 'uri' (str): URI of the item to add.
+                - 'playlist_id' (str): ID of the playlist to add the items to.
+                - 'uri' (str, optional): URI of the item to add.
+                - 'uris' (list, optional): URIs of several items to add, sent in batches of 100.
 
         Returns:
         --------
         str:
             Success or error message.
         """
-        try:
-            playlist_id = args.get("playlist_id") if args else None
-            uri = args.get("uri") if args else None
+        playlist_id = _arg(args, "playlist_id")
+        uri = _arg(args, "uri")
+        uris = _arg(args, "uris") or []
 
-            if not playlist_id or not uri:
-                return "Playlist ID and URI are required."
+        if uri:
+            uris = [uri, *uris]
 
-            self.sp.playlist_add_items(playlist_id, [uri])
-            return "Item added to the playlist successfully."
+        if not playlist_id or not uris:
+            return "Playlist ID and URI are required."
 
-        except Exception as e:
-            logger.error(f"Error adding item to playlist: {str(e)}")
-            return "Error adding item to playlist."
+        # Send the items in as few requests as possible, stopping at the first failed batch
+        for start in range(0, len(uris), _ADD_BATCH_SIZE):
+            error = self._add_playlist_batch(playlist_id, uris[start:start + _ADD_BATCH_SIZE])
+            if error:
+                return error if start == 0 else f"Error adding items to playlist, only the first {start} item(s) were added."
+
+        return "Item added to the playlist successfully." if len(uris) == 1 else f"{len(uris)} items added to the playlist successfully."
 
     @playlists
+    @_spotify_call("Error removing playlist items")
     def remove_playlist_items(self, args=None) -> str:
         """
         Removes items (tracks) from a Spotify playlist.
@@ -960,24 +1356,21 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            playlist_id = args.get("playlist_id") if args else None
-            uris = args.get("uris") if args else None
+        playlist_id = _arg(args, "playlist_id")
+        uris = _arg(args, "uris")
 
-            if not playlist_id:
-                return "Playlist ID is required."
-            if not uris or not isinstance(uris, list):
-                return "URIs must be a non-empty list."
+        if not playlist_id:
+            return "Playlist ID is required."
+        if not uris or not isinstance(uris, list):
+            return "URIs must be a non-empty list."
 
-            self.sp.playlist_remove_all_occurrences_of_items(playlist_id, uris)
-            logger.info(f"Successfully removed items from playlist {playlist_id}.")
-            return "Items removed from the playlist successfully."
-
-        except Exception as e:
-            logger.error(f"Error removing playlist items: {str(e)}")
-            return "Error removing playlist items."
+        self.sp.playlist_remove_all_occurrences_of_items(playlist_id, uris)
+        logger.info(f"Successfully removed items from playlist {playlist_id}.")
+        return "Items removed from the playlist successfully."
 
+    @read_only
     @playlists
+    @_spotify_call("Error fetching user playlists")
     def get_current_user_playlists(self, args=None) -> str:
         """
         Retrieves a list of playlists for the current Spotify user.
@@ -994,37 +1387,26 @@ class SpotifyClient:
         str:
             A formatted list of playlists or an error message.
         """
-        try:
-            playlists = []
-            offset = args.get("offset", 0) if args else 0
-            limit = args.get("limit", 20) if args else 20
+        offset = _arg(args, "offset", 0)
+        limit = _arg(args, "limit", 20)
 
-            # Paginate through all user playlists
-            while True:
-                playlists_info = self.sp.current_user_playlists(offset=offset, limit=limit)
-                if not playlists_info or not playlists_info.get('items'):
-                    if offset == 0:
-                        return "No playlists found."
-                    break
-
-                for playlist in playlists_info['items']:
-                    playlist_name = playlist['name']
-                    playlist_id = playlist['id']
-                    playlist_url = playlist['external_urls']['spotify']
-                    playlists.append(f"Playlist: {playlist_name}, ID: {playlist_id}, URL: {playlist_url}")
+        # Paginate through all user playlists
+        pages = self._paginate(
+            lambda page_offset, page_limit: self.sp.current_user_playlists(offset=page_offset, limit=page_limit),
+            offset, limit,
+        )
 
-                # Increment offset to fetch the next batch if needed
-                offset += limit
-                if len(playlists_info['items']) < limit:
-                    break
+        playlists = [
+            f"Playlist: {playlist['name']}, ID: {playlist['id']}, URL: {playlist['external_urls']['spotify']}"
+            for page in pages if page
+            for playlist in page.get('items') or []
+        ]
 
-            return '\n'.join(playlists) if playlists else "No playlists found."
-
-        except Exception as e:
-            logger.error(f"Error fetching user playlists: {str(e)}")
-            return "Error fetching user playlists."
+        return '\n'.join(playlists) if playlists else "No playlists found."
 
+    @read_only
     @playlists
+    @_spotify_call("Error fetching user playlists")
     def get_user_playlists(self, args=None) -> str:
         """
         Retrieves a list of playlists for a Spotify user.
@@ -1042,40 +1424,29 @@ class SpotifyClient:
         str:
             A formatted list of playlists or an error message.
         """
-        try:
-            user_id = args.get("user_id") if args else None
-            offset = args.get("offset", 0) if args else 0
-            limit = args.get("limit", 20) if args else 20
-
-            if not user_id:
-                return "User ID is required."
-
-            playlists = []
-            while True:
-                playlists_info = self.sp.user_playlists(user_id, offset=offset, limit=limit)
-                if not playlists_info or not playlists_info.get('items'):
-                    if offset == 0:
-                        return "No playlists found."
-                    break
+        user_id = _arg(args, "user_id")
+        offset = _arg(args, "offset", 0)
+        limit = _arg(args, "limit", 20)
 
-                for playlist in playlists_info['items']:
-                    playlist_name = playlist['name']
-                    playlist_id = playlist['id']
-                    playlist_url = playlist['external_urls']['spotify']
-                    playlists.append(f"Playlist: {playlist_name}, ID: {playlist_id}, URL: {playlist_url}")
+        if not user_id:
+            return "User ID is required."
 
-                # Increment offset to fetch the next batch if needed
-                offset += limit
-                if len(playlists_info['items']) < limit:
-                    break
+        # Paginate through all of the user's playlists
+        pages = self._paginate(
+            lambda page_offset, page_limit: self.sp.user_playlists(user_id, offset=page_offset, limit=page_limit),
+            offset, limit,
+        )
 
-            return '\n'.join(playlists) if playlists else "No playlists found."
+        playlists = [
+            f"Playlist: {playlist['name']}, ID: {playlist['id']}, URL: {playlist['external_urls']['spotify']}"
+            for page in pages if page
+            for playlist in page.get('items') or []
+        ]
 
-        except Exception as e:
-            logger.error(f"Error fetching user playlists: {str(e)}")
-            return "Error fetching user playlists."
+        return '\n'.join(playlists) if playlists else "No playlists found."
 
     @playlists
+    @_spotify_call("Error creating playlist")
     def create_playlist(self, args=None) -> str:
         """
         Creates a new Spotify playlist for the current user.
@@ -1094,31 +1465,28 @@ class SpotifyClient:
         str:
             Success message with playlist details or an error message.
         """
-        try:
-            name = args.get("name") if args else None
-            if not name:
-                return "Playlist name is required."
+        name = _arg(args, "name")
+        if not name:
+            return "Playlist name is required."
 
-            description = args.get("description", "")
-            public = args.get("public", True)
-            collaborative = args.get("collaborative", False)
+        description = _arg(args, "description", "")
+        public = _arg(args, "public", True)
+        collaborative = _arg(args, "collaborative", False)
 
-            # Create the playlist
-            result = self.sp.user_playlist_create(
-                self.sp.me()['id'], name, public=public, collaborative=collaborative, description=description
-            )
+        # Create the playlist
+        result = self.sp.user_playlist_create(
+            self._current_user_id(), name, public=public, collaborative=collaborative, description=description
+        )
 
-            if result:
-                playlist_name = result['name']
-                playlist_id = result['id']
-                playlist_url = result['external_urls']['spotify']
-                return f"Playlist '{playlist_name}' created successfully. ID: {playlist_id}, URL: {playlist_url}"
-
-        except Exception as e:
-            logger.error(f"Error creating playlist: {str(e)}")
-            return "Error creating playlist."
+        if result:
+            playlist_name = result['name']
+            playlist_id = result['id']
+            playlist_url = result['external_urls']['spotify']
+            return f"Playlist '{playlist_name}' created successfully. ID: {playlist_id}, URL: {playlist_url}"
 
+    @read_only
     @playlists
+    @_spotify_call("Error fetching featured playlists")
     def get_featured_playlists(self, args=None) -> str:
         """
         Retrieves a list of featured playlists on Spotify.
@@ -1136,30 +1504,26 @@ class SpotifyClient:
         str:
             A formatted list of featured playlists or an error message.
         """
-        try:
-            limit = min(max(args.get("limit", 10), 1), 50) if args else 10
-            country = args.get("country") if args else None
-            locale = args.get("locale") if args else None
+        limit = min(max(_arg(args, "limit", 10), 1), 50)
+        country = _arg(args, "country")
+        locale = _arg(args, "locale")
 
-            featured = self.sp.featured_playlists(limit=limit, country=country, locale=locale)
-            if not featured or not featured.get('playlists'):
-                return "No featured playlists found."
+        featured = self.sp.featured_playlists(limit=limit, country=country, locale=locale)
+        if not featured or not featured.get('playlists'):
+            return "No featured playlists found."
 
-            message = featured.get("message", "Featured Playlists:")
-            playlists_info = [message]
+        message = featured.get("message", "Featured Playlists:")
+        playlists_info = [message]
 
-            for playlist in featured['playlists']['items']:
-                playlist_name = playlist['name']
-                playlist_url = playlist['external_urls']['spotify']
-                playlists_info.append(f"Playlist: {playlist_name}, URL: {playlist_url}")
+        for playlist in featured['playlists']['items']:
+            playlist_name = playlist['name']
+            playlist_url = playlist['external_urls']['spotify']
+            playlists_info.append(f"Playlist: {playlist_name}, URL: {playlist_url}")
 
-            return '\n'.join(playlists_info)
-
-        except Exception as e:
-            logger.error(f"Error fetching featured playlists: {str(e)}")
-            return "Error fetching featured playlists."
+        return '\n'.join(playlists_info)
 
     @playlists
+    @_spotify_call("Error adding custom cover image")
     def add_custom_cover_image(self, args=None) -> str:
         """
         Adds a custom cover image to a Spotify playlist from a URL or local file path.
@@ -1179,38 +1543,42 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            playlist_id = args.get("playlist_id") if args else None
-            image_url = args.get("image_url") if args else None
-            image_path = args.get("image_path") if args else None
-
-            if not playlist_id:
-                return "Playlist ID is required."
-            if not (image_url or image_path):
-                return "Either image URL or image path is required."
-            if image_url and image_path:
-                return "Provide only one of image URL or image path."
-
-            # Convert image to base64
-            if image_url:
-                response = requests.get(image_url)
+        playlist_id = _arg(args, "playlist_id")
+        image_url = _arg(args, "image_url")
+        image_path = _arg(args, "image_path")
+
+        if not playlist_id:
+            return "Playlist ID is required."
+        if not (image_url or image_path):
+            return "Either image URL or image path is required."
+        if image_url and image_path:
+            return "Provide only one of image URL or image path."
+
+        # Convert image to base64
+        if image_url:
+            # Stream the download straight into the encoder instead of holding the raw bytes
+            with self._session.get(image_url, stream=True, timeout=10) as response:
                 if response.status_code != 200:
                     return "Error fetching the image from the URL."
-                image_base64 = base64.b64encode(response.content).decode("utf-8")
+                image_base64 = _b64encode_chunks(response.iter_content(chunk_size=_B64_CHUNK_SIZE))
 
-            elif image_path:
-                with open(image_path, "rb") as image_file:
-                    image_base64 = base64.b64encode(image_file.read()).decode("utf-8")
+        elif image_path:
+            # An empty file cannot be memory-mapped
+            if os.path.getsize(image_path) == 0:
+                return "The image file is empty."
 
-            # Upload the base64 image
-            self.sp.playlist_upload_cover_image(playlist_id, image_base64)
-            return "Custom cover image added to the playlist successfully."
+            # Encode from the mapped file pages, avoiding a copy of the file contents
+            with open(image_path, "rb") as image_file, \
+                    mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as view:
+                image_base64 = base64.b64encode(view).decode("ascii")
 
-        except Exception as e:
-            logger.error(f"Error adding custom cover image: {str(e)}")
-            return "Error adding custom cover image."
+        # Upload the base64 image
+        self.sp.playlist_upload_cover_image(playlist_id, image_base64)
+        return "Custom cover image added to the playlist successfully."
 
     @playlists
+    @_spotify_call("Error unfollowing playlist")
     def user_playlist_unfollow(self, args=None) -> str:
         """
         Unfollows (unsubscribes from) a Spotify playlist.
@@ -1226,20 +1594,17 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            logger.info(f"Arguments: {args}")
-            playlist_id = args.get("playlist_id") if args else None
-            if not playlist_id:
-                return "Playlist ID is required."
-
-            self.sp.user_playlist_unfollow(user='me', playlist_id = playlist_id)
-            return "Unfollowed the playlist successfully."
+        logger.info(f"Arguments: {args}")
+        playlist_id = _arg(args, "playlist_id")
+        if not playlist_id:
+            return "Playlist ID is required."
 
-        except Exception as e:
-            logger.error(f"Error unfollowing playlist: {str(e)}")
-            return "Error unfollowing playlist."
+        self.sp.user_playlist_unfollow(user=self._current_user_id(), playlist_id=playlist_id)
+        return "Unfollowed the playlist successfully."
 
+    @read_only
     @tracks
+    @_spotify_call("Error fetching track")
     def get_track(self, args=None) -> str:
         """
         Retrieves and formats essential information from a Spotify track.
@@ -1255,49 +1620,31 @@ class SpotifyClient:
         str:
             Formatted track information or an error message.
         """
-        try:
-            track_id = args.get("track_id") if args else None
-            if not track_id:
-                return "Track ID is required."
-
-            # Fetch track info
-            track_info = self.sp.track(track_id)
-
-            # Extract relevant information
-            name = track_info.get("name", "Unknown")
-            artist_name = track_info["artists"][0].get("name", "Unknown")
-            album_name = track_info["album"].get("name", "Unknown")
-            release_date = track_info["album"].get("release_date", "Unknown")
-            popularity = track_info.get("popularity", "Unknown")
-            explicit = "Yes" if track_info.get("explicit", False) else "No"
-            track_url = track_info["external_urls"].get("spotify", "No URL available")
-            image_url = track_info["album"].get("images", [{}])[0].get("url", "No image available")
-
-            # Format duration
-            duration_ms = track_info.get("duration_ms", 0)
-            duration_minutes = duration_ms // 60000
-            duration_seconds = (duration_ms % 60000) // 1000
-            duration = f"{duration_minutes}:{duration_seconds:02}"
-
-            # Format track information
-            result_str = (
-                f"Track Name: {name}\n"
-                f"Artist: {artist_name}\n"
-                f"Album: {album_name} - Released: {release_date}\n"
-                f"Duration: {duration} (mm:ss)\n"
-                f"Popularity: {popularity}\n"
-                f"Explicit: {explicit}\n"
-                f"Track URL: {track_url}\n"
-                f"Image: {image_url}"
-            )
-
-            return result_str
-
-        except Exception as e:
-            logger.error(f"Error fetching track: {str(e)}")
-            return "Error fetching track."
-
+        track_id = _arg(args, "track_id")
+        if not track_id:
+            return "Track ID is required."
+
+        # Fetch track info
+        track_info = self.sp.track(track_id)
+
+        album = track_info["album"]
+
+        # Extract relevant information and fill in the template
+        return _TRACK_TEMPLATE.format_map({
+            'name': track_info.get("name", "Unknown"),
+            'artist_name': track_info["artists"][0].get("name", "Unknown"),
+            'album_name': album.get("name", "Unknown"),
+            'release_date': album.get("release_date", "Unknown"),
+            'duration': _fmt_duration(track_info.get("duration_ms", 0)),
+            'popularity': track_info.get("popularity", "Unknown"),
+            'explicit': "Yes" if track_info.get("explicit", False) else "No",
+            'track_url': track_info["external_urls"].get("spotify", "No URL available"),
+            'image_url': _dig(album, "images", 0, "url", default="No image available"),
+        })
+
+    @read_only
     @tracks
+    @_spotify_call("Error fetching saved tracks")
     def get_user_saved_tracks(self, args=None) -> str:
         """
         Retrieves a list of tracks saved by the current Spotify user.
@@ -1308,50 +1655,33 @@ class SpotifyClient:
             Dictionary containing:
                 - 'limit' (int): Number of saved tracks to retrieve.
                 - 'offset' (int): Starting point for saved tracks.
+                - 'all' (bool, optional): Retrieve every saved track from the offset onwards,
+                  ignoring 'limit' (default: False).
 
         Returns:
         --------
         str:
             A formatted list of saved tracks or an error message.
         """
-        try:
-            limit = min(max(args.get("limit", 20), 1), 50) if args else 20
-            offset = args.get("offset", 0) if args else 0
-
-            # Fetch saved tracks
-            saved_tracks = self.sp.current_user_saved_tracks(limit=limit, offset=offset)
-            if not saved_tracks or not saved_tracks.get('items'):
-                return "No saved tracks found."
-
-            # Format track information
-            tracks_info = []
-            for item in saved_tracks['items']:
-                track = item.get('track')
-                if track:
-                    track_name = track.get('name', 'Unknown Track')
-                    artist_name = track['artists'][0]['name'] if track.get('artists') else 'Unknown Artist'
-                    album_name = track['album']['name'] if track.get('album') else 'Unknown Album'
-                    album_url = track['album']['external_urls']['spotify'] if track.get('album') and track['album'].get('external_urls') else 'No Album URL'
-                    track_url = track['external_urls']['spotify'] if track.get('external_urls') else 'No URL'
-                    
-                    # Convert duration to mm:ss format
-                    duration_ms = track.get('duration_ms', 0)
-                    duration_minutes = duration_ms // 60000
-                    duration_seconds = (duration_ms % 60000) // 1000
-                    duration = f"{duration_minutes}:{duration_seconds:02}"
-
-                    tracks_info.append(
-                        f"Track: {track_name}, Artist: {artist_name}, Album: {album_name}, "
-                        f"Duration: {duration}, Album URL: {album_url}, Track URL: {track_url}"
-                    )
-
-            return '\n'.join(tracks_info)
+        limit = max(_arg(args, "limit", 20), 1)
+        offset = _arg(args, "offset", 0)
+        fetch = lambda page_offset, page_limit: self.sp.current_user_saved_tracks(limit=page_limit, offset=page_offset)
 
-        except Exception as e:
-            logger.error(f"Error fetching saved tracks: {str(e)}")
-            return "Error fetching saved tracks."
+        # Fetch saved tracks, in concurrent pages of at most 50 when more are requested.
+        # For the whole library the first page's total drives the fan-out.
+        if _arg(args, "all", False):
+            pages = self._paginate(fetch, offset, 50)
+        else:
+            pages = self._paginate(fetch, offset, min(limit, 50), end=offset + limit)
+        saved_tracks = [item for page in pages if page for item in page.get('items') or []]
+        if not saved_tracks:
+            return "No saved tracks found."
+
+        # Format track information
+        return '\n'.join(_fmt_saved_track(item['track']) for item in saved_tracks if item.get('track'))
 
     @tracks
+    @_spotify_call("Error saving track")
     def save_track_for_user(self, args=None) -> str:
         """
         Saves a track to the current user's Spotify library.
@@ -1367,22 +1697,18 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            track_id = args.get("track_id") if args else None
-            if not track_id:
-                return "Track ID is required."
+        track_id = _arg(args, "track_id")
+        if not track_id:
+            return "Track ID is required."
 
-            # Handle both single and multiple track IDs
-            track_ids = [track_id] if isinstance(track_id, str) else track_id
-            self.sp.current_user_saved_tracks_add(track_ids)
-            logger.info(f"Track(s) {track_ids} saved successfully.")
-            return "Track saved successfully."
-
-        except Exception as e:
-            logger.error(f"Error saving track: {str(e)}")
-            return "Error saving track."
+        # Handle both single and multiple track IDs
+        track_ids = [track_id] if isinstance(track_id, str) else track_id
+        self.sp.current_user_saved_tracks_add(track_ids)
+        logger.info(f"Track(s) {track_ids} saved successfully.")
+        return "Track saved successfully."
 
     @tracks
+    @_spotify_call("Error removing track(s)")
     def remove_user_saved_tracks(self, args=None) -> str:
         """
         Removes one or more tracks from the current user's Spotify library.
@@ -1398,22 +1724,19 @@ class SpotifyClient:
         str:
             Success or error message.
         """
-        try:
-            track_id = args.get("track_id") if args else None
-            if not track_id:
-                return "Track ID is required."
-
-            # Handle both single and multiple track IDs
-            track_ids = [track_id] if isinstance(track_id, str) else track_id
-            self.sp.current_user_saved_tracks_delete(track_ids)
-            logger.info(f"Track(s) {track_ids} removed successfully for the user.")
-            return f"{'Track' if len(track_ids) == 1 else 'Tracks'} removed successfully."
+        track_id = _arg(args, "track_id")
+        if not track_id:
+            return "Track ID is required."
 
-        except Exception as e:
-            logger.error(f"Error removing track(s): {str(e)}")
-            return "Error removing track(s)."
+        # Handle both single and multiple track IDs
+        track_ids = [track_id] if isinstance(track_id, str) else track_id
+        self.sp.current_user_saved_tracks_delete(track_ids)
+        logger.info(f"Track(s) {track_ids} removed successfully for the user.")
+        return f"{'Track' if len(track_ids) == 1 else 'Tracks'} removed successfully."
 
+    @read_only
     @tracks
+    @_spotify_call("Error checking saved track(s)")
     def check_user_saved_tracks(self, args=None) -> str:
         """
         Checks if the current user has saved specific track(s).
@@ -1429,29 +1752,34 @@ class SpotifyClient:
         str:
             Success message indicating whether each track is saved or not.
         """
-        try:
-            track_id = args.get("track_id") if args else None
-            if not track_id:
-                return "Track ID is required."
-
-            # Handle both single and multiple track IDs
-            track_ids = [track_id] if isinstance(track_id, str) else track_id
-            is_saved = self.sp.current_user_saved_tracks_contains(track_ids)
-
-            # Generate summary of saved status
-            result = []
-            for i, track in enumerate(track_ids):
-                status = "saved" if is_saved[i] else "not saved"
-                result.append(f"Track {track} is {status}.")
-            
-            logger.info(f"Checked saved status for tracks: {track_ids}")
-            return '\n'.join(result)
+        track_id = _arg(args, "track_id")
+        if not track_id:
+            return "Track ID is required."
 
-        except Exception as e:
-            logger.error(f"Error checking saved track(s): {str(e)}")
-            return "Error checking saved track(s)."
+        # Handle both single and multiple track IDs
+        track_ids = [track_id] if isinstance(track_id, str) else track_id
+
+        # The endpoint takes at most 50 IDs, larger requests are split and checked concurrently
+        chunks = [track_ids[i:i + _SAVED_CHECK_BATCH_SIZE] for i in range(0, len(track_ids), _SAVED_CHECK_BATCH_SIZE)]
+        if len(chunks) == 1:
+            results = [self.sp.current_user_saved_tracks_contains(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, len(chunks))) as executor:
+                results = list(executor.map(self.sp.current_user_saved_tracks_contains, chunks))
+
+        is_saved = itertools.chain.from_iterable(results)
+
+        logger.info(f"Checked saved status for tracks: {track_ids}")
 
+        # Generate summary of saved status
+        return '\n'.join(
+            f"Track {track} is {'saved' if saved else 'not saved'}."
+            for track, saved in zip(track_ids, is_saved)
+        )
+
+    @read_only
     @tracks
+    @_spotify_call("Error fetching audio features")
     def get_track_audio_features(self, args=None) -> str:
         """
         Retrieves audio features of a Spotify track.
@@ -1467,53 +1795,30 @@ class SpotifyClient:
         str:
             Formatted audio features information or an error message.
         """
+        track_id = _arg(args, "track_id")
+        if not track_id:
+            return "Track ID is required."
+
+        # Fetch audio features
+        features = self.sp.audio_features(track_id)[0]
+        if not features:
+            return "No audio features found for the track."
+
+        # Extract relevant features in one pass, missing ones show up as nan instead of breaking the format spec
         try:
-            track_id = args.get("track_id") if args else None
-            if not track_id:
-                return "Track ID is required."
-
-            # Fetch audio features
-            features = self.sp.audio_features(track_id)[0]
-            if not features:
-                return "No audio features found for the track."
-
-            # Extract relevant features
-            acousticness = f"{features.get('acousticness', 'Unknown'):.3f}"
-            danceability = f"{features.get('danceability', 'Unknown'):.3f}"
-            energy = f"{features.get('energy', 'Unknown'):.3f}"
-            instrumentalness = f"{features.get('instrumentalness', 'Unknown'):.3f}"
-            liveness = f"{features.get('liveness', 'Unknown'):.3f}"
-            loudness = f"{features.get('loudness', 'Unknown'):.1f} dB"
-            speechiness = f"{features.get('speechiness', 'Unknown'):.3f}"
-            tempo = f"{features.get('tempo', 'Unknown'):.1f} BPM"
-            valence = f"{features.get('valence', 'Unknown'):.3f}"
-            
-            # Add mode and key
-            mode = "Major" if features.get('mode') == 1 else "Minor"
-            key = features.get("key", "Unknown")
-
-            # Format audio features information
-            result_str = (
-                f"Acousticness: {acousticness}\n"
-                f"Danceability: {danceability}\n"
-                f"Energy: {energy}\n"
-                f"Instrumentalness: {instrumentalness}\n"
-                f"Liveness: {liveness}\n"
-                f"Loudness: {loudness}\n"
-                f"Speechiness: {speechiness}\n"
-                f"Tempo: {tempo}\n"
-                f"Valence: {valence}\n"
-                f"Key: {key}\n"
-                f"Mode: {mode}"
-            )
+            values = dict(zip(_AUDIO_FEATURE_NAMES, _audio_feature_values(features)))
+        except KeyError:
+            values = {name: features.get(name, float('nan')) for name in _AUDIO_FEATURE_NAMES}
 
-            return result_str
+        # Add mode and key
+        values['mode'] = "Major" if features.get('mode') == 1 else "Minor"
+        values['key'] = features.get("key", "Unknown")
 
-        except Exception as e:
-            logger.error(f"Error fetching audio features: {str(e)}")
-            return "Error fetching audio features."
+        return _AUDIO_FEATURES_TEMPLATE.format_map(values)
 
+    @read_only
     @albums
+    @_spotify_call("Error fetching album")
     def get_album(self, args=None) -> str:
         """
         Retrieves and formats essential information from a Spotify album.
@@ -1529,45 +1834,32 @@ class SpotifyClient:
         str:
             Formatted album information or an error message.
         """
-        try:
-            album_id = args.get("album_id") if args else None
-            if not album_id:
-                return "Album ID is required."
-
-            # Fetch album info
-            album_info = self.sp.album(album_id)
-
-            # Extract relevant information
-            name = album_info.get("name", "Unknown")
-            artist_name = album_info["artists"][0].get("name", "Unknown")
-            release_date = album_info.get("release_date", "Unknown")
-            total_tracks = album_info.get("total_tracks", "Unknown")
-            album_type = album_info.get("album_type", "Unknown")
-            album_url = album_info["external_urls"].get("spotify", "No URL available")
-            image_url = album_info.get("images", [{}])[0].get("url", "No image available")
-            genres = ', '.join(album_info.get("genres", []))
-            label = album_info.get("label", "Unknown")
-
-            # Format album information
-            result_str = (
-                f"Album Name: {name}\n"
-                f"Artist: {artist_name}\n"
-                f"Release Date: {release_date}\n"
-                f"Total Tracks: {total_tracks}\n"
-                f"Album Type: {album_type}\n"
-                f"Genres: {genres or 'No genre information'}\n"
-                f"Label: {label}\n"
-                f"Album URL: {album_url}\n"
-                f"Image: {image_url}"
-            )
-
-            return result_str
-
-        except Exception as e:
-            logger.error(f"Error fetching album: {str(e)}")
-            return "Error fetching album."
-
+        album_id = _arg(args, "album_id")
+        if not album_id:
+            return "Album ID is required."
+
+        # Fetch album info
+        album_info = self.sp.album(album_id)
+
+        get = album_info.get
+        artists = get("artists")
+
+        # Extract relevant information and fill in the template
+        return _ALBUM_TEMPLATE.format_map({
+            'name': get("name", "Unknown"),
+            'artist_name': artists[0].get("name", "Unknown") if artists else "Unknown Artist",
+            'release_date': get("release_date", "Unknown"),
+            'total_tracks': get("total_tracks", "Unknown"),
+            'album_type': get("album_type", "Unknown"),
+            'genres': ', '.join(get("genres", [])) or 'No genre information',
+            'label': get("label", "Unknown"),
+            'album_url': _dig(album_info, "external_urls", "spotify", default="No URL available"),
+            'image_url': _dig(album_info, "images", 0, "url", default="No image available"),
+        })
+
+    @read_only
     @albums
+    @_spotify_call("Error fetching album tracks")
     def get_album_tracks(self, args=None) -> str:
         """
         Retrieves tracks from a Spotify album.
@@ -1585,47 +1877,24 @@ class SpotifyClient:
         str:
             A formatted list of album tracks or an error message.
         """
-        try:
-            album_id = args.get("album_id") if args else None
-            limit = args.get("limit", 20) if args else 20
-            offset = args.get("offset", 0) if args else 0
-
-            if not album_id:
-                return "Album ID is required."
-
-            # Fetch album tracks
-            tracks = self.sp.album_tracks(album_id, limit=limit, offset=offset)
-            if not tracks or not tracks.get('items'):
-                return "No tracks found in the album."
-
-            # Format detailed track information
-            tracks_info = []
-            for track in tracks['items']:
-                track_name = track.get('name', 'Unknown Track')
-                artist_name = track['artists'][0].get('name', 'Unknown Artist') if track.get('artists') else 'Unknown Artist'
-                duration_ms = track.get('duration_ms', 0)
-                duration_minutes = duration_ms // 60000
-                duration_seconds = (duration_ms % 60000) // 1000
-                duration = f"{duration_minutes}:{duration_seconds:02}"
-                explicit = "Yes" if track.get("explicit", False) else "No"
-                track_url = track['external_urls'].get('spotify', 'No URL')
-
-                # Append formatted track info
-                tracks_info.append(
-                    f"Track: {track_name}\n"
-                    f"Artist: {artist_name}\n"
-                    f"Duration: {duration}\n"
-                    f"Explicit: {explicit}\n"
-                    f"URL: {track_url}\n"
-                )
-
-            return '\n\n'.join(tracks_info)
+        album_id = _arg(args, "album_id")
+        limit = _arg(args, "limit", 20)
+        offset = _arg(args, "offset", 0)
 
-        except Exception as e:
-            logger.error(f"Error fetching album tracks: {str(e)}")
-            return "Error fetching album tracks."
+        if not album_id:
+            return "Album ID is required."
+
+        # Fetch album tracks
+        tracks = self.sp.album_tracks(album_id, limit=limit, offset=offset)
+        if not tracks or not tracks.get('items'):
+            return "No tracks found in the album."
+
+        # Format detailed track information
+        return '\n\n'.join(map(_fmt_album_track, tracks['items']))
 
+    @read_only
     @users
+    @_spotify_call("Error fetching top items")
     def get_user_top_items(self, args=None) -> str:
         """
         Retrieves the current user's top artists or tracks.
@@ -1643,39 +1912,33 @@ class SpotifyClient:
         str:
             A formatted list of top items or an error message.
         """
-        try:
-            top_type = args.get("type") if args else None
-            limit = args.get("limit", 10) if args else 10
-            time_range = args.get("time_range", "medium_term") if args else "medium_term"
-
-            if not top_type:
-                return "Type of top items is required."
-
-            # Fetch top items
-            if top_type == "artists":
-                top_items = self.sp.current_user_top_artists(limit=limit, time_range=time_range)
-            elif top_type == "tracks":
-                top_items = self.sp.current_user_top_tracks(limit=limit, time_range=time_range)
-            else:
-                return "Invalid type of top items. Choose 'artists' or 'tracks'."
+        top_type = _arg(args, "type")
+        limit = _arg(args, "limit", 10)
+        time_range = _arg(args, "time_range", "medium_term")
 
-            if not top_items or not top_items.get('items'):
-                return f"No top {top_type} found for the user."
+        if not top_type:
+            return "Type of top items is required."
 
-            # Format top items information
-            top_items_info = []
-            for i, item in enumerate(top_items['items']):
-                name = item.get('name', 'Unknown')
-                url = item.get('external_urls', {}).get('spotify', 'No URL available')
-                top_items_info.append(f"{i + 1}. {name} - {url}")
+        # Fetch top items
+        if top_type == "artists":
+            top_items = self.sp.current_user_top_artists(limit=limit, time_range=time_range)
+        elif top_type == "tracks":
+            top_items = self.sp.current_user_top_tracks(limit=limit, time_range=time_range)
+        else:
+            return "Invalid type of top items. Choose 'artists' or 'tracks'."
 
-            return '\n'.join(top_items_info)
+        if not top_items or not top_items.get('items'):
+            return f"No top {top_type} found for the user."
 
-        except Exception as e:
-            logger.error(f"Error fetching top items: {str(e)}")
-            return "Error fetching top items."
+        # Format top items information
+        return '\n'.join(
+            f"{i}. {item.get('name', 'Unknown')} - {_dig(item, 'external_urls', 'spotify', default='No URL available')}"
+            for i, item in enumerate(top_items['items'], start=1)
+        )
 
+    @read_only
     @users
+    @_spotify_call("Error fetching user profile")
     def get_current_user_profile(self, args=None) -> str:
         """
         Retrieves and formats essential information about the current Spotify user.
@@ -1685,34 +1948,33 @@ class SpotifyClient:
         str:
             Formatted user profile information or an error message.
         """
-        try:
-            user_info = self.sp.me()
-            if not user_info:
-                return "No user information found."
-
-            # Extract relevant information
-            display_name = user_info.get("display_name", "Unknown")
-            email = user_info.get("email", "Unknown")
-            followers = user_info.get("followers", {}).get("total", 0)
-            country = user_info.get("country", "Unknown")
-            user_url = user_info.get("external_urls", {}).get("spotify", "No URL available")
-            
-            # Check if images exist
-            image_url = user_info.get("images", [{}])[0].get("url", "No image available") if user_info.get("images") else "No image available"
-
-            # Format user profile information
-            result_str = (
-                f"Display Name: {display_name}\n"
-                f"Email: {email}\n"
-                f"Followers: {followers}\n"
-                f"Country: {country}\n"
-                f"User URL: {user_url}\n"
-                f"Image: {image_url}"
-            )
+        user_info = self.sp.me()
+        if not user_info:
+            return "No user information found."
 
-            return result_str
+        # The profile is fetched anyway, so remember the user ID for later calls
+        self._me_id = user_info.get('id') or self._me_id
 
-        except Exception as e:
-            logger.error(f"Error fetching user profile: {str(e)}")
-            return "Error fetching user profile."
+        # Extract relevant information
+        get = user_info.get
+        display_name = get("display_name", "Unknown")
+        email = get("email", "Unknown")
+        followers = _dig(user_info, "followers", "total", default=0)
+        country = get("country", "Unknown")
+        user_url = _dig(user_info, "external_urls", "spotify", default="No URL available")
+        
+        # Check if images exist
+        image_url = _dig(user_info, "images", 0, "url", default="No image available")
+
+        # Format user profile information
+        result_str = (
+            f"Display Name: {display_name}\n"
+            f"Email: {email}\n"
+            f"Followers: {followers}\n"
+            f"Country: {country}\n"
+            f"User URL: {user_url}\n"
+            f"Image: {image_url}"
+        )
+
+        return result_str
 
@@ -0,0 +1,52 @@
+import os
+import mmap
+from typing import Any
+
+import orjson
+
+# Raised by loads and load_json_file, a subclass of json.JSONDecodeError
+JSONDecodeError = orjson.JSONDecodeError
+
+# Files from this size on are memory-mapped instead of read
+_MMAP_THRESHOLD: int = 64 * 1024
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Parses a JSON document
+
+    Args:
+        data (bytes | bytearray | memoryview | str): The JSON document.
+
+    Returns:
+        Any: The parsed document.
+    """
+    return orjson.loads(data)
+
+def dumps(obj: Any) -> str:
+    """
+    Serializes an object to a JSON string
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    return orjson.dumps(obj).decode()
+
+def load_json_file(path: str) -> Any:
+    """
+    Loads a JSON file, parsing large files straight from the mapped pages to avoid a copy
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        Any: The parsed document.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+
+        return orjson.loads(file.read())
@@ -1,16 +1,34 @@
-import json
-from logging import Logger
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from logging import DEBUG, Logger
 from openai import OpenAI, Stream
 from config.settings import Config
-from collections import defaultdict
 from gina.decorators import singleton
 from gina.utils.logger import setup_logger
+from gina.utils.json_utils import JSONDecodeError, dumps
 from gina.utils.openai.persona import Persona, load_personas
+from gina.utils.openai.tool_call_parser import IncrementalToolCallParser
 from gina.utils.function_modules.functions import import_methods_from_modules, combine_tools_json
 
 log_level: str = Config.get_config_value("log_level", "INFO")
 logger: Logger = setup_logger(__name__)
 
+_DEFAULT_LLM: str = Config.get_config_value("default_LLM")
+
+@lru_cache(maxsize=1)
+def _function_dispatcher() -> dict[str, callable]:
+    """
+    Discovers the tool functions once per process
+    """
+    return import_methods_from_modules()
+
+@lru_cache(maxsize=1)
+def _tools() -> tuple[dict[str, str], ...]:
+    """
+    Combines the tool schemas once per process, the cached result is shared by every request
+    """
+    return tuple(combine_tools_json())
+
 @singleton
 class OpenAIService:
     """
@@ -24,11 +42,10 @@ class OpenAIService:
         
         self.client: OpenAI = OpenAI(api_key=api_key)
         self.messages: list[str] = []
-        self.personas: list[Persona] = []
-        self.function_dispatcher: dict[str, callable] = import_methods_from_modules()
-        self.tools: list[dict[str, str]] = combine_tools_json()
-
-        self._load_personas()
+        self.personas: list[Persona] | None = None  # loaded on the first set_persona call
+        self._persona_system_msg: dict[str, dict[str, str]] = {}
+        self.function_dispatcher: dict[str, callable] = _function_dispatcher()
+        self.tools: tuple[dict[str, str], ...] = _tools()
     
     def _load_personas(self) -> None:
         """
@@ -37,22 +54,26 @@ class OpenAIService:
         personas: list[Persona] = load_personas()
 
         self.personas = personas
+        self._persona_system_msg = {p.name.lower(): {"role": "system", "content": p.description} for p in personas}
 
         logger.debug(f"Loaded {len(personas)} persona(s)")
-        logger.debug(f"Personas: {[persona.name for persona in personas]}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Personas: %s", [persona.name for persona in personas])
 
     def set_persona(self, persona: str = "Default") -> None:
         """
         Set persona for the conversation
         """
         if persona:
-            persona_obj: Persona = next(
-                (p for p in self.personas if p.name.lower() == persona.lower()), None
-            )
+            if self.personas is None:
+                self._load_personas()
 
-            if persona_obj:
-                self.add_message(role="system", message=f"{persona_obj.description}")
-                logger.debug(f"Set persona to {persona_obj.name}")
+            persona_msg: dict[str, str] = self._persona_system_msg.get(persona.lower())
+
+            if persona_msg:
+                # Append a copy, so changes to the history never reach the cached message
+                self.messages.append(dict(persona_msg))
+                logger.debug(f"Set persona to {persona}")
             else:
                 logger.error(f"Persona {persona} not found")
 
@@ -62,36 +83,66 @@ class OpenAIService:
         """
         self.messages.append({"role": role, "content": message})
 
-    def _tool_list_to_tool_obj(self, tools):
-        # Initialize a dictionary with default values
-        tool_calls_dict = defaultdict(lambda: {"id": None, "function": {"arguments": "", "name": None}, "type": None})
-
-        # Iterate over the tool calls
-        for tool_call in tools:
-            # If the id is not None, set it
-            if tool_call.id is not None:
-                tool_calls_dict[tool_call.index]["id"] = tool_call.id
-
-            # If the function name is not None, set it
-            if tool_call.function.name is not None:
-                tool_calls_dict[tool_call.index]["function"]["name"] = tool_call.function.name
+    def _run_tool(self, function_name: str, function_args: dict | JSONDecodeError):
+        """
+        Runs a tool function, turning a missing function, malformed arguments or an error into the tool's output
+        """
+        func: callable = self.function_dispatcher.get(function_name)
 
-            # Append the arguments
-            tool_calls_dict[tool_call.index]["function"]["arguments"] += tool_call.function.arguments
+        if not func:
+            # Every tool call needs an answer, report the missing function
+            output = f"Function {function_name} not found"
+            logger.error(output)
+            return output
 
-            # If the type is not None, set it
-            if tool_call.type is not None:
-                tool_calls_dict[tool_call.index]["type"] = tool_call.type
+        if isinstance(function_args, JSONDecodeError):
+            logger.error(f"Tool {function_name} called with malformed arguments: {function_args}")
+            return f"Error executing {function_name}: invalid JSON arguments: {function_args}"
 
-        # Convert the dictionary to a list
-        tool_calls_list = list(tool_calls_dict.values())
+        try:
+            output = func(function_args)
+        except Exception as e:
+            logger.error(f"Tool {function_name} failed with arguments {function_args}: {e}")
+            return f"Error executing {function_name}: {e}"
 
-        # Return the result
-        return {"tool_calls": tool_calls_list}
+        logger.debug("Tool %s executed with arguments %s and returned %s", function_name, function_args, output)
+        return output
 
-    def get_completion(self, model: str = Config.get_config_value("default_LLM"), stream_callback = None) -> str:
+    def _run_tools(self, function_names: list[str], function_args: list[dict | JSONDecodeError]) -> list:
+        """
+        Runs the tool calls of a turn in the order they were emitted, running consecutive read-only tools concurrently
         """
-        Send message to OpenAI API
+        outputs: list = []
+        pending: list[int] = []  # indexes of the read-only calls waiting to run together
+
+        def run_pending() -> None:
+            if len(pending) == 1:
+                outputs.append(self._run_tool(function_names[pending[0]], function_args[pending[0]]))
+            elif pending:
+                with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                    outputs.extend(executor.map(
+                        self._run_tool,
+                        [function_names[i] for i in pending],
+                        [function_args[i] for i in pending],
+                    ))
+            pending.clear()
+
+        for index, function_name in enumerate(function_names):
+            if getattr(self.function_dispatcher.get(function_name), "_is_read_only", False):
+                pending.append(index)
+                continue
+
+            # Tools that change state wait for the earlier calls and run alone, their order matters
+            run_pending()
+            outputs.append(self._run_tool(function_name, function_args[index]))
+
+        run_pending()
+
+        return outputs
+
+    def get_completion(self, model: str = _DEFAULT_LLM, stream_callback = None, stream_end_callback = None) -> str:
+        """
+        Send message to OpenAI API, calling stream_end_callback once the stream is read and before any tool runs
         """
 
         stream: Stream = self.client.chat.completions.create(
@@ -101,50 +152,59 @@ class OpenAIService:
             stream=True
         )
 
-        response: str = ""
-        tools: dict = []
+        response_parts: list[str] = []
+        tool_call_parser: IncrementalToolCallParser = IncrementalToolCallParser()
+
+        # Bound methods used on every chunk are looked up once
+        append_part = response_parts.append
+        feed_tool_call = tool_call_parser.feed
 
         for chunk in stream:
-            content = chunk.choices[0].delta.content
-            if isinstance(content, str):
-                response += content
+            delta = chunk.choices[0].delta
+
+            content = delta.content
+            if content is not None:
+                append_part(content)
 
                 if stream_callback:
                     stream_callback(content)
             
-            if chunk.choices[0].delta.tool_calls:
-                tools += chunk.choices[0].delta.tool_calls
+            # Merge the tool call deltas in the same pass, their arguments are parsed once complete
+            tool_call_deltas = delta.tool_calls
+            if tool_call_deltas:
+                for tool_call in tool_call_deltas:
+                    feed_tool_call(tool_call)
 
-        tools = self._tool_list_to_tool_obj(tools)
-        logger.debug(f"Tools: {tools}")
+        # Let the caller flush what it buffered, the tools may take a while
+        if stream_end_callback:
+            stream_end_callback()
 
-        if len(tools['tool_calls']) > 0:
+        response: str = "".join(response_parts)
+
+        tool_calls: list[dict] = tool_call_parser.tool_calls()
+        logger.debug("Tools: %s", tool_calls)
+
+        if len(tool_calls) > 0:
             self.messages.append({
                 "role": "assistant",
                 "content": None,
-                "tool_calls": tools["tool_calls"]
+                "tool_calls": tool_calls
             })
 
-            tool_outputs: dict = []
-            for tool in tools['tool_calls']:
-                function_name:str = tool['function']['name']
-                function_args:str = tool['function']['arguments']
-
-                func: callable = self.function_dispatcher.get(function_name)
-
-                if func:
-                    output = func(json.loads(function_args))
-                    tool_outputs.append(output)
-                    logger.debug(f"Tool {function_name} executed with arguments {function_args} and returned {output}")
-                else:
-                    logger.error(f"Function {function_name} not found")
-                
-                self.messages.append({
+            function_names: list[str] = [tool['function']['name'] for tool in tool_calls]
+            function_args: list[dict | JSONDecodeError] = tool_call_parser.arguments()
+
+            outputs: list = self._run_tools(function_names, function_args)
+
+            self.messages.extend(
+                {
                     "role": "tool",
-                    "content": json.dumps(output),
+                    "content": dumps(output),
                     "name": function_name,
                     "tool_call_id": tool['id']
-                })
+                }
+                for tool, function_name, output in zip(tool_calls, function_names, outputs)
+            )
         else:
             self.add_message(role="assistant", message=response)
 
@@ -1,9 +1,12 @@
-import json
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import List
 from config.settings import Config
+from gina.utils.json_utils import load_json_file
 
-@dataclass
+_persona_fields = itemgetter("name", "description")
+
+@dataclass(slots=True, frozen=True)
 class Persona:
     name: str
     description: str
@@ -14,10 +17,8 @@ def load_personas() -> List[Persona]:
     """
     file_path = Config.get_config_value(key="personas_path")
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        data = json.load(file)
+    data = load_json_file(file_path)
     
-    return [
-        Persona(name=persona["name"], description=persona["description"])
-        for persona in data
-    ]
+    # Positional construction from a single itemgetter call per persona
+    return [Persona(*_persona_fields(persona)) for persona in data]
+
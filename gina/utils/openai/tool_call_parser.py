@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional
+from gina.utils.json_utils import JSONDecodeError, loads
+
+class IncrementalToolCallParser:
+    """
+    Accumulates streamed tool call deltas in a list indexed by their (small, dense) index.
+
+    The JSON structure of each call's arguments is tracked as the fragments arrive, so the
+    arguments are parsed exactly once, as soon as the top-level object is closed. Malformed
+    arguments never raise while the stream is read, the decode error is kept as the call's result.
+    """
+
+    def __init__(self) -> None:
+        self._calls: List[Optional[Dict[str, Any]]] = []
+
+    def feed(self, tool_call) -> None:
+        """
+        Merges one streamed tool call delta into the call at the same index
+        """
+        index: int = tool_call.index
+        if index >= len(self._calls):
+            self._calls.extend([None] * (index + 1 - len(self._calls)))
+
+        call: Optional[Dict[str, Any]] = self._calls[index]
+        if call is None:
+            call = self._calls[index] = {
+                "id": None,
+                "name": None,
+                "type": None,
+                "arguments": [],
+                "depth": 0,
+                "in_string": False,
+                "escape": False,
+                "parsed": None,
+            }
+
+        if tool_call.id is not None:
+            call["id"] = tool_call.id
+
+        if tool_call.function.name is not None:
+            call["name"] = tool_call.function.name
+
+        if tool_call.type is not None:
+            call["type"] = tool_call.type
+
+        fragment: str = tool_call.function.arguments
+        if fragment:
+            call["arguments"].append(fragment)
+            self._advance(call, fragment)
+
+    @staticmethod
+    def _advance(call: Dict[str, Any], fragment: str) -> None:
+        """
+        Advances the parser state of a call over a new arguments fragment
+        """
+        depth: int = call["depth"]
+        in_string: bool = call["in_string"]
+        escape: bool = call["escape"]
+        complete: bool = False
+
+        # Most fragments of long arguments are the inside of a string value, skip them with
+        # C-level membership tests when they cannot change the state
+        if in_string and not escape and '"' not in fragment and "\\" not in fragment:
+            return
+
+        for char in fragment:
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == "\\":
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{" or char == "[":
+                depth += 1
+            elif char == "}" or char == "]":
+                depth -= 1
+                complete = depth == 0
+
+        call["depth"], call["in_string"], call["escape"] = depth, in_string, escape
+
+        # The top-level object just closed, parse the arguments once
+        if complete and call["parsed"] is None:
+            call["parsed"] = IncrementalToolCallParser._parse(call)
+
+    @staticmethod
+    def _parse(call: Dict[str, Any]) -> Dict[str, Any] | JSONDecodeError:
+        """
+        Parses the accumulated arguments of a call, returning the decode error if they are malformed
+        """
+        try:
+            return loads("".join(call["arguments"]))
+        except JSONDecodeError as e:
+            return e
+
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """
+        Gets the accumulated tool calls in index order, in the format of an assistant message
+        """
+        return [
+            {
+                "id": call["id"],
+                "function": {"arguments": "".join(call["arguments"]), "name": call["name"]},
+                "type": call["type"],
+            }
+            for call in self._calls if call is not None
+        ]
+
+    def arguments(self) -> List[Dict[str, Any] | JSONDecodeError]:
+        """
+        Gets the parsed arguments of the tool calls in index order, or the decode error of malformed ones
+        """
+        return [
+            call["parsed"] if call["parsed"] is not None else (self._parse(call) if call["arguments"] else {})
+            for call in self._calls if call is not None
+        ]
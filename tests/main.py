@@ -7,9 +7,12 @@ async def main():
     auth: GraphAuthenticator = GraphAuthenticator("252e9e83-60c2-4b55-8525-e4278885346e", ["User.Read"])
     todo: ToDo = ToDo(auth.token['access_token'])
 
-    lists: dict[int, str] = await todo.get_lists()
-    
-    tasks = await todo.get_tasks(lists['Tasks'])
+    try:
+        lists: dict[str, str] = await todo.get_lists()
+        
+        tasks = await todo.get_tasks(lists['Tasks'])
+    finally:
+        await todo.aclose()
 
     with open("tests/tasks.json", "w") as f:
         f.write(json.dumps(tasks, indent=4))
@@ -0,0 +1,125 @@
+import os
+import sys
+import uuid
+import importlib
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from gina.utils.function_modules import functions
+
+_MODULE_SOURCE = """
+class Tool:
+{methods}
+"""
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    """
+    Discovers tools from a package written to a temporary directory, with the cache file next to it
+    """
+
+    def setUp(self):
+        self.root: str = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+        # Module names are built from paths relative to the working directory, as with functions_path
+        cwd: str = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+        sys.path.insert(0, self.root)
+        self.addCleanup(sys.path.remove, self.root)
+
+        self.package: str = f"gina_test_tools_{uuid.uuid4().hex}"
+        os.mkdir(self.package)
+        self.addCleanup(self.forget_modules)
+
+        cache_patcher = mock.patch.object(functions, "_discovery_cache_path", os.path.join(self.root, "cache.json"))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+        env_patcher = mock.patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop("GINA_DISABLE_DISCOVERY_CACHE", None)
+
+    def forget_modules(self) -> None:
+        """
+        Drops the test modules from sys.modules, as a new process would not have them
+        """
+        for name in [name for name in sys.modules if name.startswith(self.package)]:
+            del sys.modules[name]
+
+    def write_module(self, name: str, source: str, mtime_offset: int = 0) -> None:
+        path: str = os.path.join(self.package, f"{name}.py")
+        with open(path, "w") as f:
+            f.write(source)
+
+        # Move the mtime forward explicitly, coarse filesystem clocks could leave it unchanged
+        if mtime_offset:
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+    def write_tool(self, name: str, *method_names: str, mtime_offset: int = 0) -> None:
+        methods: str = "\n".join(f"    def {method}(self, args=None):\n        return '{method}'" for method in method_names)
+        self.write_module(name, _MODULE_SOURCE.format(methods=methods), mtime_offset)
+
+    def discover(self) -> list[str]:
+        self.forget_modules()
+        importlib.invalidate_caches()
+        return sorted(functions.import_methods_from_modules(self.package))
+
+    def cached_methods(self):
+        fingerprint: int = functions._tree_fingerprint(self.package)
+        return functions._read_discovery_cache("methods", self.package, fingerprint)
+
+    def test_cache_hit(self):
+        self.write_tool("a", "hello_a")
+
+        self.assertEqual(self.discover(), ["hello_a"])
+        self.assertEqual(self.cached_methods(), [[f"{self.package}.a", "Tool", ["hello_a"]]])
+
+        # A hit rebuilds the methods from the cache without scanning the modules again
+        with mock.patch.object(functions, "_find_main_class", side_effect=AssertionError("cache not used")):
+            self.assertEqual(self.discover(), ["hello_a"])
+
+    def test_modified_module_invalidates_the_cache(self):
+        self.write_tool("a", "hello_a")
+        self.assertEqual(self.discover(), ["hello_a"])
+
+        self.write_tool("a", "hello_a", "hello_b", mtime_offset=10)
+        self.assertIsNone(self.cached_methods())
+
+        self.assertEqual(self.discover(), ["hello_a", "hello_b"])
+        self.assertEqual(self.cached_methods(), [[f"{self.package}.a", "Tool", ["hello_a", "hello_b"]]])
+
+    def test_failed_import_is_not_cached(self):
+        self.write_tool("a", "hello_a")
+        self.write_module("b", "import gina_missing_dependency_for_tests\n" + _MODULE_SOURCE.format(methods="    def hello_b(self, args=None):\n        pass"))
+
+        self.assertEqual(self.discover(), ["hello_a"])
+        self.assertIsNone(self.cached_methods())
+
+        # Once the dependency is importable, the next run finds the module
+        open(os.path.join(self.root, "gina_missing_dependency_for_tests.py"), "w").close()
+        self.addCleanup(sys.modules.pop, "gina_missing_dependency_for_tests", None)
+
+        self.assertEqual(self.discover(), ["hello_a", "hello_b"])
+        self.assertIsNotNone(self.cached_methods())
+
+    def test_failed_instantiation_is_not_cached(self):
+        self.write_module("a", "class Tool:\n    def __init__(self, token):\n        pass\n\n    def hello_a(self, args=None):\n        pass\n")
+
+        self.assertEqual(self.discover(), [])
+        self.assertIsNone(self.cached_methods())
+
+    def test_disabled_cache_is_not_written(self):
+        os.environ["GINA_DISABLE_DISCOVERY_CACHE"] = "1"
+        self.write_tool("a", "hello_a")
+
+        self.assertEqual(self.discover(), ["hello_a"])
+        self.assertFalse(os.path.exists(functions._discovery_cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import time
+import threading
+import unittest
+from gina.decorators import read_only
+from gina.utils.json_utils import JSONDecodeError
+from gina.utils.openai.openai_service import OpenAIService
+
+# The service is a singleton, build bare instances of the class to skip the API client setup
+_OpenAIService = OpenAIService.__wrapped__
+
+
+def make_service(function_dispatcher: dict) -> _OpenAIService:
+    service = _OpenAIService.__new__(_OpenAIService)
+    service.function_dispatcher = function_dispatcher
+    return service
+
+
+class TestRunTools(unittest.TestCase):
+
+    def setUp(self):
+        self.events: list[str] = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def record(self, event: str) -> None:
+        with self.lock:
+            self.events.append(event)
+
+    def reader(self, name: str, delay: float = 0.05):
+        @read_only
+        def tool(args):
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            self.record(f"start {name}")
+            time.sleep(delay)
+            self.record(f"end {name}")
+            with self.lock:
+                self.running -= 1
+            return f"{name} {args['n']}"
+
+        return tool
+
+    def writer(self, name: str):
+        def tool(args):
+            self.record(f"start {name}")
+            self.record(f"end {name}")
+            return f"{name} {args['n']}"
+
+        return tool
+
+    def test_outputs_stay_aligned_with_the_calls(self):
+        service = make_service({
+            "fast": self.reader("fast", 0.0),
+            "slow": self.reader("slow", 0.1),
+            "write": self.writer("write"),
+        })
+
+        names = ["slow", "fast", "write", "fast", "slow"]
+        outputs = service._run_tools(names, [{"n": n} for n in range(len(names))])
+
+        self.assertEqual(outputs, ["slow 0", "fast 1", "write 2", "fast 3", "slow 4"])
+
+    def test_consecutive_read_only_calls_run_together(self):
+        service = make_service({"read": self.reader("read")})
+
+        outputs = service._run_tools(["read"] * 3, [{"n": n} for n in range(3)])
+
+        self.assertEqual(outputs, ["read 0", "read 1", "read 2"])
+        self.assertEqual(self.max_running, 3)
+
+    def test_state_changing_call_is_a_barrier(self):
+        service = make_service({
+            "read": self.reader("read"),
+            "write": self.writer("write"),
+        })
+
+        service._run_tools(["read", "read", "write", "read"], [{"n": n} for n in range(4)])
+
+        # Both reads before the write finish before it starts, the read after it starts once it is done
+        write_start = self.events.index("start write")
+        self.assertEqual(self.events[:write_start].count("end read"), 2)
+        self.assertEqual(self.events[write_start + 1], "end write")
+        self.assertEqual(self.events[write_start + 2], "start read")
+
+    def test_state_changing_calls_keep_their_order(self):
+        service = make_service({"first": self.writer("first"), "second": self.writer("second")})
+
+        service._run_tools(["second", "first", "second"], [{"n": n} for n in range(3)])
+
+        self.assertEqual(
+            [event for event in self.events if event.startswith("start")],
+            ["start second", "start first", "start second"],
+        )
+
+    def test_unknown_tool_is_reported_in_place(self):
+        service = make_service({"read": self.reader("read", 0.0)})
+
+        outputs = service._run_tools(["read", "missing", "read"], [{"n": n} for n in range(3)])
+
+        self.assertEqual(outputs, ["read 0", "Function missing not found", "read 2"])
+
+    def test_failing_tool_and_malformed_arguments_are_reported_in_place(self):
+        def broken(args):
+            raise RuntimeError("boom")
+
+        service = make_service({"broken": broken, "read": self.reader("read", 0.0)})
+        malformed = JSONDecodeError("Expecting value", "{", 1)
+
+        outputs = service._run_tools(["broken", "read", "read"], [{"n": 0}, malformed, {"n": 2}])
+
+        self.assertEqual(outputs[0], "Error executing broken: boom")
+        self.assertTrue(outputs[1].startswith("Error executing read: invalid JSON arguments"))
+        self.assertEqual(outputs[2], "read 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import time
+import random
+import threading
+import unittest
+from unittest import mock
+import spotipy
+from gina.utils.function_modules.spotify import spotify_client
+from gina.utils.function_modules.spotify.spotify_client import SpotifyClient, _spotify_call
+
+
+def rate_limited(retry_after: str = None) -> spotipy.SpotifyException:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return spotipy.SpotifyException(429, -1, "rate limited", headers=headers)
+
+
+class TestSpotifyCall(unittest.TestCase):
+
+    def setUp(self):
+        # No real waiting and no jitter, so the requested delays can be checked exactly
+        sleep_patcher = mock.patch.object(spotify_client.time, "sleep")
+        jitter_patcher = mock.patch.object(spotify_client.random, "uniform", return_value=0)
+        self.sleep = sleep_patcher.start()
+        jitter_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        self.addCleanup(jitter_patcher.stop)
+
+    def call_with(self, *outcomes):
+        """
+        Runs a decorated call that raises or returns the given outcomes in turn
+        """
+        outcomes = iter(outcomes)
+        calls: list = []
+
+        @_spotify_call("Error testing")
+        def call():
+            calls.append(None)
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return call(), len(calls)
+
+    def test_success_is_returned_as_is(self):
+        self.assertEqual(self.call_with("ok"), ("ok", 1))
+        self.sleep.assert_not_called()
+
+    def test_short_retry_after_is_honored(self):
+        result, calls = self.call_with(rate_limited("3"), "ok")
+
+        self.assertEqual((result, calls), ("ok", 2))
+        self.sleep.assert_called_once_with(3.0)
+
+    def test_retry_after_at_the_cap_is_honored(self):
+        result, calls = self.call_with(rate_limited(str(int(spotify_client._MAX_RETRY_AFTER))), "ok")
+
+        self.assertEqual((result, calls), ("ok", 2))
+        self.sleep.assert_called_once_with(spotify_client._MAX_RETRY_AFTER)
+
+    def test_long_retry_after_gives_up(self):
+        result, calls = self.call_with(rate_limited("3600"), "ok")
+
+        self.assertEqual((result, calls), ("Error testing.", 1))
+        self.sleep.assert_not_called()
+
+    def test_unparseable_retry_after_falls_back_to_backoff(self):
+        result, calls = self.call_with(rate_limited("soon"), rate_limited("later"), "ok")
+
+        self.assertEqual((result, calls), ("ok", 3))
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list], [1, 2])
+
+    def test_missing_retry_after_falls_back_to_backoff(self):
+        result, calls = self.call_with(rate_limited(), "ok")
+
+        self.assertEqual((result, calls), ("ok", 2))
+        self.sleep.assert_called_once_with(1)
+
+    def test_retries_run_out(self):
+        retries = spotify_client._RATE_LIMIT_RETRIES
+        result, calls = self.call_with(*[rate_limited("1")] * (retries + 1), "ok")
+
+        self.assertEqual((result, calls), ("Error testing.", retries + 1))
+        self.assertEqual(self.sleep.call_count, retries)
+
+    def test_other_errors_are_not_retried(self):
+        not_found = spotipy.SpotifyException(404, -1, "not found", headers={})
+
+        self.assertEqual(self.call_with(not_found, "ok"), ("Error testing.", 1))
+        self.assertEqual(self.call_with(ValueError("bad"), "ok"), ("Error testing.", 1))
+        self.sleep.assert_not_called()
+
+
+class FakeListing:
+    """
+    Serves pages of a listing of `total` items like the Spotify paging endpoints, in random order of completion
+    """
+
+    def __init__(self, total: int) -> None:
+        self.items: list[int] = list(range(total))
+        self.requests: list[tuple[int, int]] = []
+        self.lock = threading.Lock()
+
+    def fetch(self, offset: int, limit: int) -> dict:
+        with self.lock:
+            self.requests.append((offset, limit))
+        time.sleep(random.uniform(0, 0.01))
+
+        end = offset + limit
+        return {
+            "items": self.items[offset:end],
+            "total": len(self.items),
+            "next": "next-page" if end < len(self.items) else None,
+        }
+
+
+def paginate(listing: FakeListing, offset: int, page_size: int, end: int = None) -> list[int]:
+    # _paginate does not use the client's state, so no authenticated client is needed
+    pages = SpotifyClient._paginate(None, listing.fetch, offset, page_size, end=end)
+    return [item for page in pages for item in page["items"]]
+
+
+class TestPaginate(unittest.TestCase):
+
+    def test_total_multiple_of_the_page_size(self):
+        listing = FakeListing(50)
+
+        self.assertEqual(paginate(listing, 0, 10), list(range(50)))
+        self.assertEqual(sorted(listing.requests), [(0, 10), (10, 10), (20, 10), (30, 10), (40, 10)])
+
+    def test_total_not_multiple_of_the_page_size(self):
+        listing = FakeListing(45)
+
+        self.assertEqual(paginate(listing, 0, 10), list(range(45)))
+        self.assertEqual(sorted(listing.requests), [(0, 10), (10, 10), (20, 10), (30, 10), (40, 5)])
+
+    def test_empty_listing(self):
+        listing = FakeListing(0)
+
+        self.assertEqual(paginate(listing, 0, 10), [])
+        self.assertEqual(listing.requests, [(0, 10)])
+
+    def test_single_page(self):
+        listing = FakeListing(7)
+
+        self.assertEqual(paginate(listing, 0, 10), list(range(7)))
+        self.assertEqual(listing.requests, [(0, 10)])
+
+    def test_offset_and_end(self):
+        listing = FakeListing(100)
+
+        self.assertEqual(paginate(listing, 5, 10, end=32), list(range(5, 32)))
+        self.assertEqual(sorted(listing.requests), [(5, 10), (15, 10), (25, 7)])
+
+    def test_end_past_the_total(self):
+        listing = FakeListing(23)
+
+        self.assertEqual(paginate(listing, 0, 10, end=100), list(range(23)))
+        self.assertEqual(sorted(listing.requests), [(0, 10), (10, 10), (20, 3)])
+
+    def test_many_pages_keep_their_order(self):
+        listing = FakeListing(1234)
+
+        self.assertEqual(paginate(listing, 0, 50), list(range(1234)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+from types import SimpleNamespace
+from gina.utils.json_utils import JSONDecodeError
+from gina.utils.openai.tool_call_parser import IncrementalToolCallParser
+
+
+def delta(index: int, arguments: str = None, id: str = None, name: str = None, type: str = None) -> SimpleNamespace:
+    """
+    Builds a streamed tool call delta shaped like the OpenAI SDK's
+    """
+    return SimpleNamespace(
+        index=index,
+        id=id,
+        type=type,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def feed_all(parser: IncrementalToolCallParser, deltas: list) -> IncrementalToolCallParser:
+    for tool_call in deltas:
+        parser.feed(tool_call)
+    return parser
+
+
+class TestIncrementalToolCallParser(unittest.TestCase):
+
+    def test_single_call_split_across_fragments(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, "", id="call_1", name="search_track", type="function"),
+            delta(0, '{"que'),
+            delta(0, 'ry": "da'),
+            delta(0, 'ft punk", "limit": 5}'),
+        ])
+
+        self.assertEqual(parser.arguments(), [{"query": "daft punk", "limit": 5}])
+        self.assertEqual(parser.tool_calls(), [{
+            "id": "call_1",
+            "function": {"arguments": '{"query": "daft punk", "limit": 5}', "name": "search_track"},
+            "type": "function",
+        }])
+
+    def test_arguments_are_parsed_once_the_object_closes(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"a": 1', id="call_1", name="f", type="function"),
+        ])
+        self.assertIsNone(parser._calls[0]["parsed"])
+
+        parser.feed(delta(0, "}"))
+        self.assertEqual(parser._calls[0]["parsed"], {"a": 1})
+
+    def test_braces_and_quotes_inside_strings(self):
+        arguments = '{"text": "a } b { c ] [", "quote": "say \\"hi\\" }"}'
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, arguments[:12], id="call_1", name="f", type="function"),
+            delta(0, arguments[12:30]),
+            delta(0, arguments[30:]),
+        ])
+
+        self.assertEqual(parser.arguments(), [{"text": "a } b { c ] [", "quote": 'say "hi" }'}])
+
+    def test_escape_split_across_fragments(self):
+        # The backslash ends one fragment, so the quote starting the next one is escaped
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"quote": "a\\', id="call_1", name="f", type="function"),
+            delta(0, '"}'),
+        ])
+        self.assertIsNone(parser._calls[0]["parsed"])
+
+        parser.feed(delta(0, '"}'))
+        self.assertEqual(parser.arguments(), [{"quote": 'a"}'}])
+
+        # An escaped backslash split across fragments does not escape the closing quote
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"path": "a\\', id="call_1", name="f", type="function"),
+            delta(0, '\\"}'),
+        ])
+        self.assertEqual(parser.arguments(), [{"path": "a\\"}])
+
+    def test_string_only_fragments_are_skipped(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"text": "', id="call_1", name="f", type="function"),
+            delta(0, "long string fragment without quotes"),
+            delta(0, ' and more {braces}'),
+            delta(0, '"}'),
+        ])
+
+        self.assertEqual(parser.arguments(), [{"text": "long string fragment without quotes and more {braces}"}])
+
+    def test_nested_objects_and_arrays(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"uris": ["a", "b"], ', id="call_1", name="f", type="function"),
+            delta(0, '"opts": {"x": [1, {"y": 2}]}}'),
+        ])
+
+        self.assertEqual(parser.arguments(), [{"uris": ["a", "b"], "opts": {"x": [1, {"y": 2}]}}])
+
+    def test_interleaved_indices_keep_index_order(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(1, '{"b":', id="call_2", name="second", type="function"),
+            delta(0, '{"a":', id="call_1", name="first", type="function"),
+            delta(1, ' 2}'),
+            delta(0, ' 1}'),
+        ])
+
+        self.assertEqual([call["id"] for call in parser.tool_calls()], ["call_1", "call_2"])
+        self.assertEqual(parser.arguments(), [{"a": 1}, {"b": 2}])
+
+    def test_gaps_in_indices_are_skipped(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(2, "{}", id="call_3", name="f", type="function"),
+        ])
+
+        self.assertEqual([call["id"] for call in parser.tool_calls()], ["call_3"])
+        self.assertEqual(parser.arguments(), [{}])
+
+    def test_call_without_arguments(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, None, id="call_1", name="pause_playback", type="function"),
+        ])
+
+        self.assertEqual(parser.arguments(), [{}])
+
+    def test_malformed_arguments_do_not_raise(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"a": tru', id="call_1", name="bad", type="function"),
+            delta(0, "e, }"),
+            delta(1, '{"b": 2}', id="call_2", name="good", type="function"),
+        ])
+
+        bad, good = parser.arguments()
+        self.assertIsInstance(bad, JSONDecodeError)
+        self.assertEqual(good, {"b": 2})
+
+    def test_unterminated_arguments_return_the_decode_error(self):
+        parser = feed_all(IncrementalToolCallParser(), [
+            delta(0, '{"a": "never closed', id="call_1", name="f", type="function"),
+        ])
+
+        self.assertIsInstance(parser.arguments()[0], JSONDecodeError)
+
+
+if __name__ == "__main__":
+    unittest.main()